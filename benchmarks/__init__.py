@@ -0,0 +1,24 @@
+"""
+Benchmarks for the graph, ancestor, social and adventure projects.
+
+The bench_*.py modules are standalone scripts for individual changes.
+The suite in cases.py times every traversal and search over generated
+inputs from 1e2 to 1e6 vertices and writes JSON for comparing runs:
+
+    python -m benchmarks --output before.json
+    python -m benchmarks --output after.json --compare before.json
+"""
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+PROJECTS = os.path.join(ROOT, 'projects')
+
+# Graph, Queue and Stack come from the graphs package at the repository
+# root; the projects import their own siblings by bare module name.
+for project in ('adventure', 'social', 'ancestor'):
+    path = os.path.join(PROJECTS, project)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,50 @@
+"""
+Run the benchmark suite: python -m benchmarks --help
+"""
+import argparse
+import fnmatch
+
+from .cases import CASES, SIZES
+from .harness import load_results, time_case, write_results
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__)
+    parser.add_argument('--case', action='append', default=[],
+                        help='glob of case names to run (repeatable, default all)')
+    parser.add_argument('--max-size', type=int, default=max(SIZES),
+                        help='skip sizes above this (default %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='JSON file from an earlier run to compare against')
+    parser.add_argument('--list', action='store_true', help='list case names and exit')
+    args = parser.parse_args()
+
+    if args.list:
+        print('\n'.join(CASES))
+        return
+
+    patterns = args.case or ['*']
+    names = [name for name in CASES if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)]
+    baseline = load_results(args.compare) if args.compare else {}
+
+    results = []
+    print(f'{"case":<32} {"size":>8} {"min s":>10} {"mean s":>10} {"vs base":>8}')
+    for name in names:
+        for size in SIZES:
+            if size > args.max_size:
+                continue
+            result = time_case(CASES[name], size, args.repeat)
+            result['case'] = name
+            results.append(result)
+            change = ''
+            if (name, size) in baseline:
+                change = f'{result["min"] / baseline[(name, size)]:.2f}x'
+            print(f'{name:<32} {size:>8} {result["min"]:>10.5f} {result["mean"]:>10.5f} {change:>8}', flush=True)
+
+    if args.output:
+        write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Compare Graph.bfs with Graph.bidirectional_bfs for point-to-point queries
+on random friendship graphs generated by SocialGraph.populate_graph.
+
+Run from the repository root:
+    python benchmarks/bench_bidirectional.py
+"""
+import os
+import random
+import sys
+import timeit
+
+PROJECTS = os.path.join(os.path.dirname(__file__), '..', 'projects')
+sys.path.insert(0, os.path.join(PROJECTS, '..'))
+sys.path.insert(0, os.path.join(PROJECTS, 'social'))
+
+from graphs import Graph  # noqa: E402
+from social import SocialGraph  # noqa: E402
+
+
+def social_graph(num_users, avg_friendships, seed):
+    sg = SocialGraph()
+    sg.populate_graph(num_users, avg_friendships, seed=seed)
+    graph = Graph()
+    for user_id in sg.friendships:
+        graph.add_vertex(user_id)
+    for user_id, friends in sg.friendships.items():
+        for friend_id in friends:
+            graph.add_edge(user_id, friend_id)
+    return graph
+
+
+def main(sizes=((1_000, 10), (10_000, 20), (100_000, 20)), num_queries=200, seed=0):
+    print(f'{"users":>7} {"avg":>4} {"bfs s":>9} {"bidir s":>9} {"speedup":>8}')
+    for num_users, avg_friendships in sizes:
+        graph = social_graph(num_users, avg_friendships, seed)
+        rng = random.Random(seed)
+        pairs = [(rng.randint(1, num_users), rng.randint(1, num_users)) for _ in range(num_queries)]
+        bfs_time = min(timeit.repeat(lambda: [graph.bfs(*pair) for pair in pairs], number=1, repeat=3))
+        bidir_time = min(timeit.repeat(lambda: [graph.bidirectional_bfs(*pair) for pair in pairs], number=1, repeat=3))
+        print(f'{num_users:>7} {avg_friendships:>4} {bfs_time:>9.4f} {bidir_time:>9.4f} {bfs_time / bidir_time:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Compare memory use and traversal speed of the dict-of-sets Graph against
+its frozen CSRGraph on random directed graphs.
+
+Run from the repository root:
+    python benchmarks/bench_csr.py
+"""
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from graphs import Graph  # noqa: E402
+
+
+def random_graph(num_vertices, num_edges, seed=0):
+    rng = random.Random(seed)
+    graph = Graph()
+    for i in range(num_vertices):
+        graph.add_vertex(i)
+    for _ in range(num_edges):
+        graph.add_edge(rng.randrange(num_vertices), rng.randrange(num_vertices))
+    return graph
+
+
+def traced(build):
+    """Return (result, peak bytes allocated while building it)."""
+    tracemalloc.start()
+    result = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak
+
+
+def main(sizes=((10_000, 100_000), (100_000, 1_000_000))):
+    print(f'{"V":>8} {"E":>9} {"dict MB":>8} {"csr MB":>7} {"dict bft s":>11} {"csr bft s":>10}')
+    for num_vertices, num_edges in sizes:
+        graph, dict_bytes = traced(lambda: random_graph(num_vertices, num_edges))
+        frozen, csr_bytes = traced(graph.freeze)
+        dict_time = min(timeit.repeat(lambda: sum(1 for _ in graph.breadth_first_iter(0)), number=1, repeat=3))
+        csr_time = min(timeit.repeat(lambda: sum(1 for _ in frozen.breadth_first_iter(0)), number=1, repeat=3))
+        print(f'{num_vertices:>8} {num_edges:>9} {dict_bytes / 2**20:>8.1f} {csr_bytes / 2**20:>7.1f}'
+              f' {dict_time:>11.4f} {csr_time:>10.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Compare the allocations made by one traversal of the dict-of-sets Graph
+and of an IndexedGraph holding the same random directed graph.
+
+tracemalloc reports the peak memory each traversal allocates on top of
+the graph itself, and the number of memory blocks it has allocated and
+not yet freed when it yields its last vertex.
+
+Run from the repository root:
+    python benchmarks/bench_indexed.py
+"""
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from graphs import Graph, IndexedGraph  # noqa: E402
+
+
+def random_graphs(num_vertices, num_edges, seed=0):
+    rng = random.Random(seed)
+    graph = Graph()
+    indexed = IndexedGraph(num_vertices)
+    for i in range(num_vertices):
+        graph.add_vertex(i)
+    for _ in range(num_edges):
+        v1, v2 = rng.randrange(num_vertices), rng.randrange(num_vertices)
+        graph.add_edge(v1, v2)
+        indexed.add_edge(v1, v2)
+    return graph, indexed
+
+
+def traced(traversal, num_reached):
+    """
+    Return (peak bytes, live blocks) allocated by running traversal to its
+    last vertex. Blocks are counted while the traversal is still suspended
+    there, so its queue, stack and visited state are all alive.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    blocks = 0
+    for count, _ in enumerate(traversal, 1):
+        if count == num_reached:
+            after = tracemalloc.take_snapshot()
+            blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, blocks
+
+
+def main(sizes=((10_000, 50_000), (100_000, 500_000))):
+    print(f'{"V":>8} {"traversal":>10} {"dict KB":>9} {"idx KB":>8}'
+          f' {"dict blks":>10} {"idx blks":>9} {"dict s":>8} {"idx s":>8}')
+    for num_vertices, num_edges in sizes:
+        graph, indexed = random_graphs(num_vertices, num_edges)
+        for label, name in (('bft', 'breadth_first_iter'), ('dft', 'depth_first_stack_iter')):
+            dict_iter = getattr(graph, name)
+            indexed_iter = getattr(indexed, name)
+            num_reached = sum(1 for _ in indexed_iter(0))
+            dict_peak, dict_blocks = traced(dict_iter(0), num_reached)
+            indexed_peak, indexed_blocks = traced(indexed_iter(0), num_reached)
+            dict_time = min(timeit.repeat(lambda: sum(1 for _ in dict_iter(0)), number=1, repeat=3))
+            indexed_time = min(timeit.repeat(lambda: sum(1 for _ in indexed_iter(0)), number=1, repeat=3))
+            print(f'{num_vertices:>8} {label:>10} {dict_peak / 1024:>9.0f} {indexed_peak / 1024:>8.0f}'
+                  f' {dict_blocks:>10} {indexed_blocks:>9} {dict_time:>8.4f} {indexed_time:>8.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare building a Graph edge by edge with Graph.from_edges, and loading
+a saved CSR file with mmap against rebuilding the graph, on random
+directed graphs.
+
+Run from the repository root:
+    python benchmarks/bench_ingest.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from graphs import CSRGraph, Graph  # noqa: E402
+
+
+def random_edges(num_vertices, num_edges, seed=0):
+    rng = random.Random(seed)
+    return [(rng.randrange(num_vertices), rng.randrange(num_vertices)) for _ in range(num_edges)]
+
+
+def add_one_by_one(num_vertices, edges):
+    graph = Graph()
+    for i in range(num_vertices):
+        graph.add_vertex(i)
+    for v1, v2 in edges:
+        graph.add_edge(v1, v2)
+    return graph
+
+
+def count_breadth_first(graph, starting_vertex=0):
+    return sum(1 for _ in graph.breadth_first_iter(starting_vertex))
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main(sizes=((100_000, 1_000_000), (1_000_000, 5_000_000))):
+    print(f'{"V":>8} {"E":>9} {"add s":>7} {"from s":>7} {"save s":>7}'
+          f' {"load s":>7} {"load KB":>8} {"mmap bft s":>11}')
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'graph.csr')
+        for num_vertices, num_edges in sizes:
+            edges = random_edges(num_vertices, num_edges)
+            _, add_time = timed(add_one_by_one, num_vertices, edges)
+            graph, from_time = timed(Graph.from_edges, edges, range(num_vertices))
+            frozen = graph.freeze()
+            del graph
+            _, save_time = timed(frozen.save, path)
+            del frozen
+
+            tracemalloc.start()
+            loaded, load_time = timed(CSRGraph.load, path)
+            _, load_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            _, bft_time = timed(count_breadth_first, loaded)
+            del loaded
+            print(f'{num_vertices:>8} {num_edges:>9} {add_time:>7.2f} {from_time:>7.2f} {save_time:>7.2f}'
+                  f' {load_time:>7.4f} {load_peak / 1024:>8.0f} {bft_time:>11.2f}')
+
+
+if __name__ == '__main__':
+    main()
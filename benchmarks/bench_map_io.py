@@ -0,0 +1,71 @@
+"""
+Time loading a generated 100k-room map into World from each map format,
+and the peak memory of the load.
+
+Run from the repository root:
+    python benchmarks/bench_map_io.py
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'projects', 'adventure'))
+
+from map_io import write_map, room_graph_records  # noqa: E402
+from world import World  # noqa: E402
+
+
+def comb_map(width, height):
+    """
+    A room_graph shaped like a comb: a corridor along y=0 with a north-south
+    tooth rising from every room in it.
+    """
+    room_graph = {}
+    for x in range(width):
+        for y in range(height):
+            room_id = x * height + y
+            exits = {}
+            if y > 0:
+                exits['s'] = room_id - 1
+            if y < height - 1:
+                exits['n'] = room_id + 1
+            if y == 0 and x > 0:
+                exits['w'] = room_id - height
+            if y == 0 and x < width - 1:
+                exits['e'] = room_id + height
+            room_graph[room_id] = [(x, y), exits]
+    return room_graph
+
+
+def time_load(path):
+    world = World()
+    tracemalloc.start()
+    start = time.perf_counter()
+    world.load_file(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(world.rooms)
+
+
+def main(width=400, height=250):
+    room_graph = comb_map(width, height)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = {extension: os.path.join(tmp_dir, f'map{extension}') for extension in ('.txt', '.rooms', '.roomsb')}
+        with open(paths['.txt'], 'w') as map_file:
+            map_file.write(repr(room_graph))
+        write_map(room_graph_records(room_graph), paths['.rooms'])
+        write_map(room_graph_records(room_graph), paths['.roomsb'])
+        del room_graph
+
+        print(f'{"format":>8} {"rooms":>7} {"load s":>7} {"peak MB":>8} {"file MB":>8}')
+        for extension, path in paths.items():
+            elapsed, peak, num_rooms = time_load(path)
+            print(f'{extension:>8} {num_rooms:>7} {elapsed:>7.2f} {peak / 2**20:>8.1f}'
+                  f' {os.path.getsize(path) / 2**20:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Time SocialGraph.populate_graph with the rejection-sampling and (if numpy
+is installed) vectorized strategies up to 1M users, and the quadratic
+shuffle strategy on the sizes it can handle.
+
+Run from the repository root:
+    python benchmarks/bench_populate.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'projects', 'social'))
+
+from social import SocialGraph, np  # noqa: E402
+
+SHUFFLE_LIMIT = 2_000
+
+
+def time_populate(num_users, avg_friendships, strategy):
+    sg = SocialGraph()
+    start = time.perf_counter()
+    sg.populate_graph(num_users, avg_friendships, strategy=strategy, seed=0)
+    return time.perf_counter() - start
+
+
+def main(sizes=(1_000, 2_000, 10_000, 100_000, 1_000_000), avg_friendships=10):
+    print(f'{"users":>9} {"sample s":>9} {"numpy s":>8} {"shuffle s":>10}')
+    for num_users in sizes:
+        sample_time = time_populate(num_users, avg_friendships, 'sample')
+        if np is not None:
+            numpy_time = f'{time_populate(num_users, avg_friendships, "numpy"):>8.3f}'
+        else:
+            numpy_time = f'{"-":>8}'
+        if num_users <= SHUFFLE_LIMIT:
+            shuffle_time = f'{time_populate(num_users, avg_friendships, "shuffle"):>10.3f}'
+        else:
+            shuffle_time = f'{"-":>10}'
+        print(f'{num_users:>9} {sample_time:>9.3f} {numpy_time} {shuffle_time}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Micro-benchmark comparing the deque-backed graphs.Queue against the old
+list-backed queue (pop(0)) as the BFS frontier grows.
+
+Run from the repository root:
+    python benchmarks/bench_queue.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from graphs import Queue  # noqa: E402
+
+
+class ListQueue():
+    """The previous list-backed implementation, kept for comparison."""
+    def __init__(self):
+        self.queue = []
+    def enqueue(self, value):
+        self.queue.append(value)
+    def dequeue(self):
+        if self.size() > 0:
+            return self.queue.pop(0)
+        else:
+            return None
+    def size(self):
+        return len(self.queue)
+
+
+def drain(queue_class, frontier_size):
+    """Fill a queue to frontier_size, then drain it."""
+    queue = queue_class()
+    for i in range(frontier_size):
+        queue.enqueue(i)
+    while queue.size() > 0:
+        queue.dequeue()
+
+
+def main(sizes=(1_000, 10_000, 100_000, 200_000), repeat=3):
+    print(f'{"frontier":>10} {"list (s)":>12} {"deque (s)":>12} {"speedup":>9}')
+    for size in sizes:
+        list_time = min(timeit.repeat(lambda: drain(ListQueue, size), number=1, repeat=repeat))
+        deque_time = min(timeit.repeat(lambda: drain(Queue, size), number=1, repeat=repeat))
+        print(f'{size:>10} {list_time:>12.5f} {deque_time:>12.5f} {list_time / deque_time:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Compare the memory held by a World of Room objects with a compact
+RoomTable for the same generated map.
+
+Run from the repository root:
+    python benchmarks/bench_rooms.py
+"""
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'projects', 'adventure'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_map_io import comb_map  # noqa: E402
+from map_io import write_map, room_graph_records  # noqa: E402
+from world import World  # noqa: E402
+
+
+def retained_bytes(path, compact):
+    gc.collect()
+    tracemalloc.start()
+    world = World()
+    world.load_file(path, compact=compact)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, world.num_rooms
+
+
+def main(sizes=((100, 100), (400, 250), (1000, 500))):
+    print(f'{"rooms":>8} {"Room MB":>8} {"table MB":>9} {"B/room":>7} {"B/room":>7} {"ratio":>6}')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'map.roomsb')
+        for width, height in sizes:
+            write_map(room_graph_records(comb_map(width, height)), path)
+            objects_bytes, num_rooms = retained_bytes(path, compact=False)
+            table_bytes, _ = retained_bytes(path, compact=True)
+            print(f'{num_rooms:>8} {objects_bytes / 2**20:>8.1f} {table_bytes / 2**20:>9.1f}'
+                  f' {objects_bytes // num_rooms:>7} {table_bytes // num_rooms:>7}'
+                  f' {objects_bytes / table_bytes:>5.1f}x')
+
+
+if __name__ == '__main__':
+    main()
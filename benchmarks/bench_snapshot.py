@@ -0,0 +1,51 @@
+"""
+Measure Graph.add_edge throughput with and without continuous snapshots:
+in the snapshotting run a fresh snapshot is taken and held before every
+write, the worst case for copy-on-write, as when readers keep asking for
+the latest version while one writer streams edges.
+
+Run from the repository root:
+    python benchmarks/bench_snapshot.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from graphs import Graph  # noqa: E402
+
+
+def edges_per_second(graph, snapshots, rng, seconds=0.5, max_writes=100_000):
+    """
+    Add random edges for up to seconds (or max_writes edges) and return
+    the rate; with snapshots, snapshot() is called before every write.
+    """
+    num_vertices = len(graph.vertices)
+    # The first snapshot builds the copy-on-write mirrors (O(V), once).
+    held = [graph.snapshot()] if snapshots else []
+    writes = 0
+    start = time.perf_counter()
+    while writes < max_writes and time.perf_counter() - start < seconds:
+        if snapshots:
+            # Keep the last few alive, as readers still traversing them would.
+            held.append(graph.snapshot())
+            del held[:-4]
+        graph.add_edge(rng.randrange(num_vertices), rng.randrange(num_vertices))
+        writes += 1
+    return writes / (time.perf_counter() - start)
+
+
+def main(sizes=(10_000, 100_000, 1_000_000)):
+    print(f'{"V":>9} {"plain edges/s":>14} {"snapshot edges/s":>17}')
+    for num_vertices in sizes:
+        rng = random.Random(0)
+        graph = Graph.from_edges((), vertices=range(num_vertices))
+        plain = edges_per_second(graph, False, rng)
+        snapshotting = edges_per_second(graph, True, rng)
+        print(f'{num_vertices:>9} {plain:>14.0f} {snapshotting:>17.0f}')
+
+
+if __name__ == '__main__':
+    main()
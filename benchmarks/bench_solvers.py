@@ -0,0 +1,79 @@
+"""
+Compare move counts and solve times of the adventure traversal solvers
+on every map in projects/adventure/maps and on generated mazes of 10k-100k
+rooms. Each path is verified by walking it with a Player.
+
+(path_finder.find_path is left out: it does not run as checked in.)
+
+Run from the repository root:
+    python benchmarks/bench_solvers.py
+"""
+import os
+import sys
+import time
+
+ADVENTURE = os.path.join(os.path.dirname(__file__), '..', 'projects', 'adventure')
+sys.path.insert(0, ADVENTURE)
+sys.path.insert(0, os.path.join(ADVENTURE, '..', '..'))
+
+import pf2  # noqa: E402
+import tree_solver  # noqa: E402
+from maze_gen import generate_maze  # noqa: E402
+from player import Player  # noqa: E402
+from world import World  # noqa: E402
+
+# (rooms, loop density) of the generated mazes, all with seed 0.
+GENERATED = ((10_000, 0.0), (10_000, 0.1), (100_000, 0.05))
+
+SOLVERS = {
+    'pf2': pf2.find_path,
+    'tree_solver': tree_solver.find_path,
+}
+
+
+def verify(world, traversal_path):
+    player = Player(world.starting_room)
+    visited_rooms = {player.current_room}
+    for move in traversal_path:
+        player.travel(move)
+        visited_rooms.add(player.current_room)
+    return len(visited_rooms) == world.num_rooms
+
+
+def map_files():
+    maps_dir = os.path.join(ADVENTURE, 'maps')
+    return sorted(
+        os.path.join(maps_dir, name) for name in os.listdir(maps_dir)
+        if os.path.splitext(name)[1] in ('.txt', '.rooms', '.roomsb')
+    )
+
+
+def worlds():
+    """
+    Yield (name, world) for every map file, then every generated maze.
+    """
+    for map_file in map_files():
+        world = World()
+        world.load_file(map_file)
+        yield os.path.basename(map_file), world
+    for num_rooms, loop_density in GENERATED:
+        world = World()
+        world.load_graph(generate_maze(num_rooms, loop_density, seed=0))
+        yield f'gen-{num_rooms}-{loop_density}', world
+
+
+def main():
+    print(f'{"map":>18} {"rooms":>6} ' + ' '.join(f'{name + " moves":>17} {"s":>7}' for name in SOLVERS))
+    for name, world in worlds():
+        row = f'{name:>18} {world.num_rooms:>6} '
+        for find_path in SOLVERS.values():
+            start = time.perf_counter()
+            traversal_path = find_path(world.starting_room)
+            elapsed = time.perf_counter() - start
+            moves = str(len(traversal_path)) if verify(world, traversal_path) else 'FAILED'
+            row += f'{moves:>17} {elapsed:>7.3f} '
+        print(row.rstrip())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""
+Benchmark cases. Each case takes an input size, does its (untimed) setup
+and returns the zero-argument callable to time.
+"""
+import io
+import random
+import sys
+
+from ancestor import AncestryIndex, earliest_ancestor
+from social import SocialGraph
+from world import World
+import pf2
+import tree_solver
+
+from .generators import maze_room_graph, random_graph, random_pedigree
+
+SIZES = (10**2, 10**3, 10**4, 10**5, 10**6)
+
+CASES = {}
+
+
+def case(name):
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+def quietly(function, *args):
+    """
+    Call function with stdout discarded, for the printing traversals.
+    """
+    def run():
+        stdout_ = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            function(*args)
+        finally:
+            sys.stdout = stdout_  # Restore stdout
+    return run
+
+
+def random_pair(size, seed=1):
+    rng = random.Random(seed)
+    return rng.randrange(size), rng.randrange(size)
+
+
+@case('graph.bft')
+def graph_bft(size):
+    return quietly(random_graph(size).bft, 0)
+
+
+@case('graph.dft')
+def graph_dft(size):
+    return quietly(random_graph(size).dft, 0)
+
+
+@case('graph.dft_recursive')
+def graph_dft_recursive(size):
+    return quietly(random_graph(size).dft_recursive, 0)
+
+
+@case('graph.bfs')
+def graph_bfs(size):
+    graph = random_graph(size)
+    start, dest = random_pair(size)
+    return lambda: graph.bfs(start, dest)
+
+
+@case('graph.bidirectional_bfs')
+def graph_bidirectional_bfs(size):
+    graph = random_graph(size)
+    start, dest = random_pair(size)
+    return lambda: graph.bidirectional_bfs(start, dest)
+
+
+@case('graph.dfs')
+def graph_dfs(size):
+    graph = random_graph(size)
+    start, dest = random_pair(size)
+    return lambda: graph.dfs(start, dest)
+
+
+@case('graph.dfs_recursive')
+def graph_dfs_recursive(size):
+    graph = random_graph(size)
+    start, dest = random_pair(size)
+    return lambda: graph.dfs_recursive(start, dest)
+
+
+@case('graph.freeze.bfs')
+def graph_frozen_bfs(size):
+    frozen = random_graph(size).freeze()
+    start, dest = random_pair(size)
+    return lambda: frozen.bfs(start, dest)
+
+
+@case('graph.multi_source_bfs')
+def graph_multi_source_bfs(size):
+    graph = random_graph(size)
+    sources = random.Random(1).sample(range(size), min(size, 100))
+    return lambda: graph.multi_source_bfs(sources)
+
+
+@case('graph.bfs_many')
+def graph_bfs_many(size):
+    # 100 queries from 10 sources, as for a small cohort of users.
+    graph = random_graph(size)
+    rng = random.Random(1)
+    sources = [rng.randrange(size) for _ in range(10)]
+    pairs = [(rng.choice(sources), rng.randrange(size)) for _ in range(100)]
+    return lambda: graph.bfs_many(pairs)
+
+
+@case('ancestor.earliest_ancestor')
+def ancestor_earliest(size):
+    ancestors = random_pedigree(size)
+    return lambda: earliest_ancestor(ancestors, size - 1)
+
+
+@case('ancestor.AncestryIndex.all')
+def ancestor_index_all(size):
+    ancestors = random_pedigree(size)
+    return lambda: AncestryIndex(ancestors).earliest_ancestors(range(size))
+
+
+@case('social.populate_graph')
+def social_populate(size):
+    return lambda: SocialGraph().populate_graph(size, 10, seed=0)
+
+
+@case('social.get_all_social_paths')
+def social_paths(size):
+    sg = SocialGraph()
+    sg.populate_graph(size, 10, seed=0)
+    return lambda: sg.get_all_social_paths(1)
+
+
+@case('social.network_stats')
+def social_network_stats(size):
+    sg = SocialGraph()
+    sg.populate_graph(size, 10, seed=0)
+    return lambda: sg.network_stats(1)
+
+
+@case('social.streaming_components')
+def social_streaming_components(size):
+    # Users arrive first, then friendships stream in with the union-find
+    # live and a component-size query after each one.
+    rng = random.Random(0)
+    pairs = [(rng.randint(1, size), rng.randint(1, size)) for _ in range(size)]
+    pairs = list({(min(pair), max(pair)) for pair in pairs if pair[0] != pair[1]})
+
+    def run():
+        sg = SocialGraph()
+        for i in range(size):
+            sg.add_user(f"User {i + 1}")
+        sg.connected_components()
+        for user_id, friend_id in pairs:
+            sg.add_friendship(user_id, friend_id)
+            sg.component_size(user_id)
+        return sg.connected_components()
+    return run
+
+
+@case('adventure.World.print_rooms')
+def adventure_print_rooms(size):
+    world = World()
+    world.load_graph(maze_room_graph(size))
+    return quietly(world.print_rooms)
+
+
+@case('adventure.pf2.find_path')
+def adventure_pf2(size):
+    world = World()
+    world.load_graph(maze_room_graph(size))
+    return lambda: pf2.find_path(world.starting_room)
+
+
+@case('adventure.tree_solver.find_path')
+def adventure_tree_solver(size):
+    world = World()
+    world.load_graph(maze_room_graph(size))
+    return lambda: tree_solver.find_path(world.starting_room)
@@ -0,0 +1,43 @@
+"""
+Seeded input generators for the benchmark suite.
+"""
+import random
+
+from graphs import Graph
+from maze_gen import generate_maze
+
+
+def random_graph(num_vertices, avg_degree=4, seed=0):
+    """
+    A directed Graph on vertices 0..num_vertices-1 with about
+    num_vertices * avg_degree random edges.
+    """
+    rng = random.Random(seed)
+    graph = Graph()
+    for i in range(num_vertices):
+        graph.add_vertex(i)
+    for _ in range(num_vertices * avg_degree):
+        graph.add_edge(rng.randrange(num_vertices), rng.randrange(num_vertices))
+    return graph
+
+
+def random_pedigree(num_people, max_parents=2, seed=0):
+    """
+    (parent, child) pairs where each person after the first few has up to
+    max_parents parents drawn from people with lower ids, so the ancestry
+    is acyclic.
+    """
+    rng = random.Random(seed)
+    ancestors = []
+    for child in range(1, num_people):
+        for parent in rng.sample(range(max(0, child - 1000), child), min(child, rng.randint(0, max_parents))):
+            ancestors.append((parent, child))
+    return ancestors
+
+
+
+def maze_room_graph(num_rooms, loop_density=0.05, seed=0):
+    """
+    A seeded maze_gen maze with a few loops.
+    """
+    return generate_maze(num_rooms, loop_density, seed)
@@ -0,0 +1,44 @@
+"""
+Timing and JSON reporting for the benchmark suite.
+"""
+import json
+import platform
+import time
+
+
+def time_case(setup, size, repeat):
+    """
+    Run setup(size) once, then time the returned callable repeat times.
+    """
+    run = setup(size)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return {
+        'size': size,
+        'repeat': repeat,
+        'min': min(timings),
+        'mean': sum(timings) / len(timings),
+    }
+
+
+def write_results(results, path):
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+    with open(path, 'w') as results_file:
+        json.dump(report, results_file, indent=2)
+
+
+def load_results(path):
+    """
+    Return {(case, size): min seconds} from a JSON report.
+    """
+    with open(path) as results_file:
+        report = json.load(results_file)
+    return {(result['case'], result['size']): result['min'] for result in report['results']}
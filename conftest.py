@@ -0,0 +1,2 @@
+# Lets pytest import the graphs package from a source checkout without
+# `pip install -e .`: pytest puts this file's directory on sys.path.
@@ -0,0 +1,35 @@
+"""
+Graph, queue, stack and union-find implementations shared by the projects.
+
+    from graphs import Graph, Queue
+
+Submodules are imported the first time one of their names is used, so
+importing the package itself costs next to nothing.
+"""
+import importlib
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    'AsyncGraph': 'async_graph',
+    'Graph': 'graph',
+    'GraphSnapshot': 'graph',
+    'CSRGraph': 'csr',
+    'IndexedGraph': 'indexed',
+    'Queue': 'util',
+    'Stack': 'util',
+    'UnionFind': 'union_find',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
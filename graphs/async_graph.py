@@ -0,0 +1,241 @@
+"""
+Graph traversals over adjacency that is fetched asynchronously.
+
+AsyncGraph wraps a coroutine function that returns a vertex's neighbors,
+such as a lookup in a key-value store. Instead of awaiting one lookup at a
+time, the breadth-first traversals request the neighbors of a whole
+frontier level at once, and the depth-first traversals look up a bounded
+window of vertices ahead of the walk, so the latency of the lookups
+overlaps.
+
+    async def fetch(vertex):
+        return await store.get_neighbors(vertex)
+
+    graph = AsyncGraph(fetch)
+    async with contextlib.aclosing(graph.depth_first_iter(1)) as vertices:
+        async for vertex in vertices:
+            ...
+
+A depth-first traversal abandoned part way may go on to finish up to
+LOOKAHEAD * max_concurrency lookups ahead of where it stopped, but no
+more, until it is closed; aclose() (or aclosing, as above) cancels them
+at once.
+"""
+import asyncio
+
+# How many times max_concurrency vertices a depth-first traversal may have
+# looked up ahead of the walk.
+LOOKAHEAD = 4
+
+
+class AsyncGraph:
+    """Read-only graph whose neighbor lookups are awaitables."""
+    def __init__(self, fetch_neighbors, max_concurrency=32):
+        """
+        fetch_neighbors is a coroutine function taking a vertex and
+        returning an iterable of its neighbors, or None for a vertex that
+        is not in the graph. max_concurrency caps the number of lookups
+        a traversal has in flight at once, and (times LOOKAHEAD) the
+        number of vertices a depth-first traversal looks up ahead of the
+        walk.
+        """
+        if max_concurrency < 1:
+            raise Exception('max_concurrency must be at least 1')
+        self.fetch_neighbors = fetch_neighbors
+        self.max_concurrency = max_concurrency
+
+    @classmethod
+    def from_vertices(cls, vertices, max_concurrency=32):
+        """
+        Wrap a dict of neighbor sets (the Graph.vertices layout).
+        """
+        async def fetch_neighbors(vertex):
+            return vertices.get(vertex)
+        return cls(fetch_neighbors, max_concurrency)
+
+    def _fetcher(self):
+        """
+        Return a coroutine function fetching neighbors for one traversal:
+        it shares the concurrency limit and raises for unknown vertices.
+        """
+        limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(vertex):
+            async with limit:
+                neighbors = await self.fetch_neighbors(vertex)
+            if neighbors is None:
+                raise Exception(f'vertex "{vertex}" not in graph')
+            return neighbors
+        return fetch
+
+    async def get_neighbors(self, vertex_id):
+        """
+        Get all neighbors (edges) of a vertex.
+        """
+        return list(await self._fetcher()(vertex_id))
+
+    async def _breadth_first(self, starting_vertex):
+        """
+        Yield (vertex, parents) in breadth-first order, one level at a
+        time. The neighbors of every vertex in a level are requested
+        together before any of the level is yielded.
+        """
+        fetch = self._fetcher()
+        parents = {starting_vertex: None}
+        frontier = [starting_vertex]
+        while frontier:
+            requests = [asyncio.ensure_future(fetch(vertex)) for vertex in frontier]
+            try:
+                levels = await asyncio.gather(*requests)
+            except BaseException:
+                # One lookup failed (or the traversal was cancelled): stop
+                # the rest of the level instead of leaving them running.
+                for request in requests:
+                    request.cancel()
+                await asyncio.gather(*requests, return_exceptions=True)
+                raise
+            next_frontier = []
+            for cur_vertex, neighbors in zip(frontier, levels):
+                yield cur_vertex, parents
+                for vertex in neighbors:
+                    if vertex not in parents:
+                        parents[vertex] = cur_vertex
+                        next_frontier.append(vertex)
+            frontier = next_frontier
+
+    async def breadth_first_iter(self, starting_vertex):
+        traversal = self._breadth_first(starting_vertex)
+        try:
+            async for vertex, _ in traversal:
+                yield vertex
+        finally:
+            await traversal.aclose()
+
+    async def _depth_first(self, starting_vertex):
+        """
+        Yield (vertex, path) in depth-first preorder, where path is the
+        shared list of vertices from starting_vertex to vertex.
+
+        Lookups run ahead of the walk like a second, speculative
+        depth-first search: whenever neighbors arrive, the unvisited ones
+        are pushed onto a stack of candidates, and candidates are looked
+        up from the top while fewer than max_concurrency lookups are in
+        flight and fewer than LOOKAHEAD * max_concurrency looked-up
+        vertices are waiting for the walk to enter them. The vertex the
+        walk needs next is always looked up, so a traversal never makes
+        more than LOOKAHEAD * max_concurrency + 1 lookups beyond the
+        vertices it has yielded.
+        """
+        fetch = self._fetcher()
+        max_in_flight = self.max_concurrency
+        max_waiting = LOOKAHEAD * self.max_concurrency
+        visited = {starting_vertex}
+        # Lookups for vertices the walk hasn't entered yet.
+        requests = {}
+        # Discovered vertices not looked up yet, the next to try last.
+        candidates = []
+        in_flight = 0
+        closed = False
+
+        def request(vertex):
+            nonlocal in_flight
+            task = asyncio.ensure_future(fetch(vertex))
+            requests[vertex] = task
+            in_flight += 1
+            task.add_done_callback(arrived)
+            return task
+
+        def arrived(task):
+            nonlocal in_flight
+            in_flight -= 1
+            if closed or task.cancelled() or task.exception() is not None:
+                return
+            # Reversed, so the first neighbor - the one the walk will try
+            # first - is on top.
+            candidates.extend(vertex for vertex in reversed(list(task.result())) if vertex not in visited)
+            refill()
+
+        def refill():
+            while candidates and in_flight < max_in_flight and len(requests) < max_waiting:
+                vertex = candidates.pop()
+                if vertex not in visited and vertex not in requests:
+                    request(vertex)
+
+        async def neighbors_of(vertex):
+            task = requests.get(vertex) or request(vertex)
+            try:
+                neighbors = list(await task)
+            finally:
+                del requests[vertex]
+            refill()
+            return iter(neighbors)
+
+        try:
+            path = [starting_vertex]
+            frames = [await neighbors_of(starting_vertex)]
+            yield starting_vertex, path
+            while frames:
+                for vertex in frames[-1]:
+                    if vertex not in visited:
+                        visited.add(vertex)
+                        path.append(vertex)
+                        frames.append(await neighbors_of(vertex))
+                        yield vertex, path
+                        break
+                else:
+                    frames.pop()
+                    path.pop()
+        finally:
+            # Cancel lookups the walk never got to, e.g. when a search
+            # returns early.
+            closed = True
+            for task in requests.values():
+                task.cancel()
+            await asyncio.gather(*requests.values(), return_exceptions=True)
+
+    async def depth_first_iter(self, starting_vertex):
+        traversal = self._depth_first(starting_vertex)
+        try:
+            async for vertex, _ in traversal:
+                yield vertex
+        finally:
+            await traversal.aclose()
+
+    async def bfs(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing the shortest path from
+        starting_vertex to destination_vertex in
+        breath-first order.
+        """
+        # Like Graph.bfs, raise for an unknown destination up front
+        # rather than searching everything first.
+        await self._fetcher()(destination_vertex)
+        traversal = self._breadth_first(starting_vertex)
+        try:
+            async for vertex, parents in traversal:
+                if vertex == destination_vertex:
+                    path = [vertex]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    path.reverse()
+                    return path
+        finally:
+            await traversal.aclose()
+        return None
+
+    async def dfs(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing a path from
+        starting_vertex to destination_vertex in
+        depth-first order.
+        """
+        await self._fetcher()(destination_vertex)
+        traversal = self._depth_first(starting_vertex)
+        try:
+            async for vertex, path in traversal:
+                if vertex == destination_vertex:
+                    return list(path)
+        finally:
+            # Cancels any prefetches still in flight.
+            await traversal.aclose()
+        return None
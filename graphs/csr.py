@@ -0,0 +1,236 @@
+"""
+Frozen compressed sparse row (CSR) graph.
+
+Vertices are remapped to the integers 0..n-1 (in insertion order) and the
+neighbors of vertex i are indices[indptr[i]:indptr[i + 1]]. Both arrays are
+flat machine-integer arrays, so an edge costs 8 bytes instead of a set slot
+plus a boxed Python object.
+
+save() writes the three arrays to a binary file that load() maps back
+into memory with mmap, so a saved graph can be traversed without reading
+it into Python objects first:
+
+    header   4-byte magic b'CSRG', uint32 flags, uint64 vertex count,
+             uint64 edge count (little-endian)
+    labels   int64 per vertex (omitted when the labels are 0..n-1)
+    indptr   int64 per vertex, plus one
+    indices  int64 per edge
+"""
+import mmap
+import struct
+import sys
+from array import array
+
+FILE_MAGIC = b'CSRG'
+FILE_HEADER = struct.Struct('<4sIQQ')
+# Header flag: the labels are 0..n-1 and are not stored.
+RANGE_LABELS = 1
+
+
+class CSRGraph:
+    """Read-only, array-backed graph produced by Graph.freeze()."""
+    def __init__(self, labels, indptr, indices):
+        self.labels = labels
+        # A range maps each label to itself without building a dict.
+        if isinstance(labels, range):
+            self.index = labels
+        else:
+            self.index = {label: i for i, label in enumerate(labels)}
+        self.indptr = indptr
+        self.indices = indices
+
+    @classmethod
+    def from_vertices(cls, vertices):
+        """
+        Build a CSRGraph from a dict mapping vertex labels to sets of
+        neighbor labels (the Graph.vertices layout).
+        """
+        labels = list(vertices)
+        index = {label: i for i, label in enumerate(labels)}
+        indptr = array('q', [0])
+        indices = array('q')
+        for label in labels:
+            indices.extend(sorted(index[neighbor] for neighbor in vertices[label]))
+            indptr.append(len(indices))
+        return cls(labels, indptr, indices)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, vertex):
+        if isinstance(self.index, range):
+            return isinstance(vertex, int) and vertex in self.index
+        return vertex in self.index
+
+    @property
+    def num_edges(self):
+        return len(self.indices)
+
+    def _vertex_index(self, vertex):
+        if vertex not in self:
+            raise Exception(f'vertex "{vertex}" not in graph')
+        return self.index[vertex]
+
+    def save(self, path):
+        """
+        Write the graph to path in the binary CSR format. Every label must
+        be an int that fits in 64 bits.
+        """
+        labels = self.labels
+        if not all(isinstance(label, int) for label in labels):
+            raise Exception('only graphs with integer vertices can be saved')
+        num_vertices = len(labels)
+        range_labels = all(label == i for i, label in enumerate(labels))
+        with open(path, 'wb') as graph_file:
+            graph_file.write(FILE_HEADER.pack(
+                FILE_MAGIC, RANGE_LABELS if range_labels else 0, num_vertices, len(self.indices)))
+            arrays = [self.indptr, self.indices]
+            if not range_labels:
+                arrays.insert(0, labels)
+            for values in arrays:
+                values = array('q', values)
+                if sys.byteorder != 'little':
+                    values.byteswap()
+                values.tofile(graph_file)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Map a file written by save() into memory. The arrays are read
+        from the page cache as the graph is traversed; only the labels of
+        a graph whose vertices aren't 0..n-1 are loaded up front, to
+        build the label index.
+        """
+        if sys.byteorder != 'little':
+            raise Exception('memory-mapped graphs need a little-endian machine')
+        with open(path, 'rb') as graph_file:
+            header = graph_file.read(FILE_HEADER.size)
+            if len(header) != FILE_HEADER.size:
+                raise Exception(f'"{path}" is not a CSR graph file')
+            magic, flags, num_vertices, num_edges = FILE_HEADER.unpack(header)
+            if magic != FILE_MAGIC:
+                raise Exception(f'"{path}" is not a CSR graph file')
+            num_labels = 0 if flags & RANGE_LABELS else num_vertices
+            size = FILE_HEADER.size + 8 * (num_labels + num_vertices + 1 + num_edges)
+            mapped = mmap.mmap(graph_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapped) != size:
+            mapped.close()
+            raise Exception(f'"{path}" does not match its header size')
+        # The memoryviews keep the mapping open after the file is closed.
+        view = memoryview(mapped)[FILE_HEADER.size:].cast('q')
+        if flags & RANGE_LABELS:
+            labels = range(num_vertices)
+        else:
+            labels = view[:num_labels]
+        indptr = view[num_labels:num_labels + num_vertices + 1]
+        indices = view[num_labels + num_vertices + 1:]
+        return cls(labels, indptr, indices)
+
+    def get_neighbors(self, vertex_id):
+        """
+        Get all neighbors (edges) of a vertex.
+        """
+        i = self._vertex_index(vertex_id)
+        labels = self.labels
+        return [labels[j] for j in self.indices[self.indptr[i]:self.indptr[i + 1]]]
+
+    def breadth_first_iter(self, starting_vertex):
+        start = self._vertex_index(starting_vertex)
+        indptr = self.indptr
+        indices = self.indices
+        labels = self.labels
+        visited = bytearray(len(labels))
+        visited[start] = 1
+        # The visit order doubles as the queue: head walks it while new
+        # vertices are appended to the tail.
+        order = [start]
+        head = 0
+        while head < len(order):
+            cur = order[head]
+            head += 1
+            yield labels[cur]
+            for j in indices[indptr[cur]:indptr[cur + 1]]:
+                if not visited[j]:
+                    visited[j] = 1
+                    order.append(j)
+
+    def _depth_first(self, start):
+        """
+        Yield (vertex index, stack) in depth-first preorder. The stack holds
+        the vertex indices from start to the yielded vertex.
+        """
+        indptr = self.indptr
+        indices = self.indices
+        visited = bytearray(len(self.labels))
+        visited[start] = 1
+        stack = [start]
+        # Position of the next unexplored edge for each vertex on the stack.
+        offsets = [indptr[start]]
+        yield start, stack
+        while stack:
+            cur = stack[-1]
+            offset = offsets[-1]
+            end = indptr[cur + 1]
+            while offset < end and visited[indices[offset]]:
+                offset += 1
+            if offset == end:
+                stack.pop()
+                offsets.pop()
+                continue
+            offsets[-1] = offset + 1
+            next_vertex = indices[offset]
+            visited[next_vertex] = 1
+            stack.append(next_vertex)
+            offsets.append(indptr[next_vertex])
+            yield next_vertex, stack
+
+    def depth_first_stack_iter(self, starting_vertex):
+        labels = self.labels
+        for i, _ in self._depth_first(self._vertex_index(starting_vertex)):
+            yield labels[i]
+
+    def bfs(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing the shortest path from
+        starting_vertex to destination_vertex in
+        breath-first order.
+        """
+        start = self._vertex_index(starting_vertex)
+        dest = self._vertex_index(destination_vertex)
+        indptr = self.indptr
+        indices = self.indices
+        parents = array('q', [-1]) * len(self.labels)
+        parents[start] = start
+        order = [start]
+        head = 0
+        while head < len(order):
+            cur = order[head]
+            head += 1
+            if cur == dest:
+                return self._build_path(parents, dest)
+            for j in indices[indptr[cur]:indptr[cur + 1]]:
+                if parents[j] == -1:
+                    parents[j] = cur
+                    order.append(j)
+        return None
+
+    def _build_path(self, parents, dest):
+        path = [dest]
+        while parents[path[-1]] != path[-1]:
+            path.append(parents[path[-1]])
+        labels = self.labels
+        return [labels[i] for i in reversed(path)]
+
+    def dfs(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing a path from
+        starting_vertex to destination_vertex in
+        depth-first order.
+        """
+        start = self._vertex_index(starting_vertex)
+        dest = self._vertex_index(destination_vertex)
+        labels = self.labels
+        for i, stack in self._depth_first(start):
+            if i == dest:
+                return [labels[j] for j in stack]
+        return None
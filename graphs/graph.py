@@ -0,0 +1,570 @@
+"""
+Simple graph implementation
+"""
+import threading
+from collections.abc import Mapping
+
+from .util import Queue
+
+# Number of pieces the adjacency of a snapshotted graph is split into, so
+# that the first write after a snapshot copies one piece, not all of it.
+SNAPSHOT_CHUNKS = 1024
+
+class Graph:
+    """Represent a graph as a dictionary of vertices mapping labels to edges."""
+    def __init__(self):
+        self.vertices = {}
+        # Reverse adjacency index (vertex -> vertices with an edge to it),
+        # kept in step with vertices by add_vertex/add_edge.
+        self.predecessors = {}
+        # Number of writes so far; a snapshot records the version it shows.
+        self.version = 0
+        # Serializes writers against snapshot(); readers never take it.
+        self._lock = threading.Lock()
+        # The latest snapshot, until the next write makes it stale.
+        self._snapshot = None
+        # Copy-on-write mirrors of vertices and predecessors that snapshots
+        # are taken from. None until the first snapshot: before that
+        # writes only touch the two dicts.
+        self._mirrors = None
+
+    def __iter__(self):
+        pass
+
+    def breadth_first_iter(self, starting_vertex):
+        visited = set()
+        need_to_visit = Queue()
+        if starting_vertex not in self.vertices:
+            raise Exception(f'vertex "{starting_vertex}" not in graph')
+        cur_vertex = starting_vertex
+
+        def add_to_queue(target):
+            nonlocal visited
+            nonlocal need_to_visit
+            for vertex in target:
+                if vertex not in visited:
+                    visited.add(vertex)
+                    need_to_visit.enqueue(vertex)
+
+        add_to_queue(self.vertices[cur_vertex])
+        yield cur_vertex
+        visited.add(cur_vertex)
+        while need_to_visit.size() > 0:
+            cur_vertex = need_to_visit.dequeue()
+            add_to_queue(self.vertices[cur_vertex])
+            yield cur_vertex
+
+    def _depth_first(self, starting_vertex):
+        """
+        Yield (vertex, path) in depth-first preorder, where path lists the
+        vertices from starting_vertex to vertex.
+
+        Each vertex on the path keeps one iterator over its neighbors, so
+        every edge is looked at once and a whole traversal is O(V + E).
+        path is a single list shared by every step: it is only valid until
+        the next vertex is requested, so copy it to keep it.
+        """
+        vertices = self.vertices
+        visited = {starting_vertex}
+        path = [starting_vertex]
+        frames = [iter(vertices[starting_vertex])]
+        yield starting_vertex, path
+        while frames:
+            for vertex in frames[-1]:
+                if vertex not in visited:
+                    visited.add(vertex)
+                    path.append(vertex)
+                    frames.append(iter(vertices[vertex]))
+                    yield vertex, path
+                    break
+            else:
+                frames.pop()
+                path.pop()
+
+    def depth_first_stack_iter(self, starting_vertex, with_paths=False):
+        """
+        Yield each vertex in depth-first order beginning from
+        starting_vertex, or (vertex, path) pairs if with_paths is set.
+        The path list is reused between steps; copy it to keep it.
+        """
+        if starting_vertex not in self.vertices:
+            raise Exception(f'vertex "{starting_vertex}" not in graph')
+        if with_paths:
+            yield from self._depth_first(starting_vertex)
+        else:
+            for vertex, _ in self._depth_first(starting_vertex):
+                yield vertex
+
+    @classmethod
+    def from_edges(cls, edges, vertices=()):
+        """
+        Build a graph from an iterable of (v1, v2) directed edges, such as
+        the ancestors list or rows read from a CSV file, consuming it as it
+        goes. Vertices are added the first time an edge mentions them, and
+        repeated edges are ignored; vertices adds any isolated vertices.
+        """
+        graph = cls()
+        adjacency = graph.vertices
+        predecessors = graph.predecessors
+        for vertex in vertices:
+            if vertex not in adjacency:
+                adjacency[vertex] = set()
+                predecessors[vertex] = set()
+        for v1, v2 in edges:
+            # Most edges join vertices that already exist, so try the adds
+            # first and only check which vertex is new when one fails.
+            try:
+                adjacency[v1].add(v2)
+                predecessors[v2].add(v1)
+            except KeyError:
+                for vertex in (v1, v2):
+                    if vertex not in adjacency:
+                        adjacency[vertex] = set()
+                        predecessors[vertex] = set()
+                adjacency[v1].add(v2)
+                predecessors[v2].add(v1)
+        return graph
+
+    def add_vertex(self, vertex_id):
+        """
+        Add a vertex to the graph.
+        """
+        with self._lock:
+            if vertex_id in self.vertices:
+                raise Exception(f'vertex "{vertex_id}" already exists in graph')
+            if self._mirrors is None:
+                self.vertices[vertex_id] = set()
+                self.predecessors[vertex_id] = set()
+            else:
+                for mirror in self._mirrors:
+                    mirror.add(vertex_id)
+            self._snapshot = None
+            self.version += 1
+
+    def add_edge(self, v1, v2):
+        """
+        Add a directed edge to the graph.
+        """
+        error: str = None
+        TEMPLATE = 'vertex "{}" is not in graph'
+        if v1 not in self.vertices:
+            error = TEMPLATE.format(v1)
+        if v2 not in self.vertices:
+            error = TEMPLATE.format(v2) if error == ''\
+                else f'{error} and {TEMPLATE.format(v2)}'
+        if error:
+            raise Exception(error)
+        with self._lock:
+            if self._mirrors is None:
+                self.vertices[v1].add(v2)
+                self.predecessors[v2].add(v1)
+            else:
+                vertices, predecessors = self._mirrors
+                vertices.writable(v1).add(v2)
+                predecessors.writable(v2).add(v1)
+            self._snapshot = None
+            self.version += 1
+
+    def snapshot(self):
+        """
+        Return a read-only GraphSnapshot of the graph as it is now.
+
+        Threads can traverse a snapshot without locks while another
+        thread keeps adding vertices and edges; traversing the live graph
+        during writes is not safe.
+
+        Snapshots are cheap to take and don't slow writes down much: the
+        first one builds a mirror of the adjacency split into
+        SNAPSHOT_CHUNKS pieces (O(V), once), and each snapshot after that
+        just shares the pieces and neighbor sets. A write copies the
+        piece and the set it changes, if a snapshot still shares them, so
+        it costs O(V / SNAPSHOT_CHUNKS + SNAPSHOT_CHUNKS + degree).
+        """
+        with self._lock:
+            if self._snapshot is None:
+                if self._mirrors is None:
+                    self._mirrors = (
+                        _CopyOnWriteMirror(self.vertices),
+                        _CopyOnWriteMirror(self.predecessors),
+                    )
+                vertices, predecessors = self._mirrors
+                self._snapshot = GraphSnapshot(vertices.freeze(), predecessors.freeze(), self.version)
+            return self._snapshot
+
+    def get_neighbors(self, vertex_id):
+        """
+        Get all neighbors (edges) of a vertex.
+        """
+        return list(self.vertices[vertex_id])
+
+    def freeze(self):
+        """
+        Return a read-only CSRGraph snapshot of this graph with the same
+        traversal and search API.
+        """
+        from .csr import CSRGraph
+        return CSRGraph.from_vertices(self.vertices)
+
+    def bft(self, starting_vertex):
+        """
+        Print each vertex in breadth-first order
+        beginning from starting_vertex.
+        """
+        for vertex in self.breadth_first_iter(starting_vertex):
+            print(vertex)
+
+    def dft(self, starting_vertex):
+        """
+        Print each vertex in depth-first order
+        beginning from starting_vertex.
+        """
+        for vertext in self.depth_first_stack_iter(starting_vertex):
+            print(vertext)
+
+    def dft_recursive(self, starting_vertex):
+        """
+        Print each vertex in depth-first order
+        beginning from starting_vertex.
+
+        Visits vertices in the same order as the recursive version, but
+        keeps the call frames (one neighbor iterator per vertex) on an
+        explicit stack so deep graphs cannot hit the recursion limit.
+        """
+        if starting_vertex not in self.vertices:
+            return
+
+        visited = {starting_vertex}
+        print(starting_vertex)
+        frames = [iter(self.vertices[starting_vertex])]
+        while frames:
+            for next_vertex in frames[-1]:
+                if next_vertex not in visited:
+                    print(next_vertex)
+                    visited.add(next_vertex)
+                    frames.append(iter(self.vertices[next_vertex]))
+                    break
+            else:
+                frames.pop()
+
+    def bfs(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing the shortest path from
+        starting_vertex to destination_vertex in
+        breath-first order.
+        """
+        if starting_vertex not in self.vertices:
+            raise Exception(f'vertex "{starting_vertex}" not in graph')
+        elif destination_vertex not in self.vertices:
+            raise Exception(f'vertex "{destination_vertex}" not in graph')
+
+        # Record each vertex's predecessor instead of copying a path per
+        # vertex; the path is only built once the destination is reached.
+        parents = {starting_vertex: None}
+        need_to_visit = Queue()
+        need_to_visit.enqueue(starting_vertex)
+        while need_to_visit:
+            cur_vertex = need_to_visit.dequeue()
+            if cur_vertex == destination_vertex:
+                return self._build_path(parents, cur_vertex)
+            for vertex in self.vertices[cur_vertex]:
+                if vertex not in parents:
+                    parents[vertex] = cur_vertex
+                    need_to_visit.enqueue(vertex)
+        return None
+
+    @staticmethod
+    def _build_path(parents, destination_vertex):
+        """
+        Walk a predecessor map back from destination_vertex and return the
+        path from the root (the vertex whose parent is None).
+        """
+        path = [destination_vertex]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return path
+
+    def bidirectional_bfs(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing the shortest path from
+        starting_vertex to destination_vertex, searching forward from
+        the start and backward (over predecessors) from the destination
+        one level at a time, always expanding the smaller frontier.
+        """
+        if starting_vertex not in self.vertices:
+            raise Exception(f'vertex "{starting_vertex}" not in graph')
+        elif destination_vertex not in self.vertices:
+            raise Exception(f'vertex "{destination_vertex}" not in graph')
+        if starting_vertex == destination_vertex:
+            return [starting_vertex]
+
+        forward_parents = {starting_vertex: None}
+        backward_parents = {destination_vertex: None}
+        forward_depths = {starting_vertex: 0}
+        backward_depths = {destination_vertex: 0}
+        forward_frontier = [starting_vertex]
+        backward_frontier = [destination_vertex]
+
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                adjacency = self.vertices
+                parents, depths = forward_parents, forward_depths
+                other_depths = backward_depths
+                frontier = forward_frontier
+            else:
+                adjacency = self.predecessors
+                parents, depths = backward_parents, backward_depths
+                other_depths = forward_depths
+                frontier = backward_frontier
+
+            # Finish the whole level before stopping: meetings found in the
+            # same level can differ in length on the other side.
+            meeting = None
+            best_length = None
+            next_frontier = []
+            for cur_vertex in frontier:
+                next_depth = depths[cur_vertex] + 1
+                for vertex in adjacency[cur_vertex]:
+                    if vertex not in parents:
+                        parents[vertex] = cur_vertex
+                        depths[vertex] = next_depth
+                        next_frontier.append(vertex)
+                    if vertex in other_depths:
+                        length = depths[vertex] + other_depths[vertex]
+                        if best_length is None or length < best_length:
+                            meeting, best_length = vertex, length
+            if meeting is not None:
+                path = self._build_path(forward_parents, meeting)
+                vertex = backward_parents[meeting]
+                while vertex is not None:
+                    path.append(vertex)
+                    vertex = backward_parents[vertex]
+                return path
+
+            if frontier is forward_frontier:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+        return None
+
+    def multi_source_bfs(self, sources):
+        """
+        Search breadth-first from all of sources at once and return
+        (distances, nearest): dicts mapping every reachable vertex to its
+        distance from the closest source and to that source. Ties go to
+        the source listed first.
+        """
+        distances = {}
+        nearest = {}
+        frontier = []
+        for source in sources:
+            if source not in self.vertices:
+                raise Exception(f'vertex "{source}" not in graph')
+            if source not in distances:
+                distances[source] = 0
+                nearest[source] = source
+                frontier.append(source)
+        # The visit order doubles as the queue; every source is at depth 0,
+        # so vertices are still reached in order of distance.
+        head = 0
+        while head < len(frontier):
+            cur_vertex = frontier[head]
+            head += 1
+            next_distance = distances[cur_vertex] + 1
+            for vertex in self.vertices[cur_vertex]:
+                if vertex not in distances:
+                    distances[vertex] = next_distance
+                    nearest[vertex] = nearest[cur_vertex]
+                    frontier.append(vertex)
+        return distances, nearest
+
+    def bfs_many(self, pairs):
+        """
+        Return a list with bfs(starting_vertex, destination_vertex) for each
+        pair in pairs. Pairs that share a starting vertex share a single
+        breadth-first search, which stops once all their destinations have
+        been reached.
+        """
+        pairs = list(pairs)
+        destinations = {}
+        for starting_vertex, destination_vertex in pairs:
+            for vertex in (starting_vertex, destination_vertex):
+                if vertex not in self.vertices:
+                    raise Exception(f'vertex "{vertex}" not in graph')
+            destinations.setdefault(starting_vertex, set()).add(destination_vertex)
+
+        searches = {}
+        for starting_vertex, targets in destinations.items():
+            remaining = set(targets)
+            parents = {starting_vertex: None}
+            remaining.discard(starting_vertex)
+            need_to_visit = Queue()
+            need_to_visit.enqueue(starting_vertex)
+            while need_to_visit and remaining:
+                cur_vertex = need_to_visit.dequeue()
+                for vertex in self.vertices[cur_vertex]:
+                    if vertex not in parents:
+                        parents[vertex] = cur_vertex
+                        remaining.discard(vertex)
+                        need_to_visit.enqueue(vertex)
+            searches[starting_vertex] = parents
+
+        return [
+            self._build_path(searches[starting_vertex], destination_vertex)
+            if destination_vertex in searches[starting_vertex] else None
+            for starting_vertex, destination_vertex in pairs
+        ]
+
+    def dfs(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing a path from
+        starting_vertex to destination_vertex in
+        depth-first order.
+        """
+        if starting_vertex not in self.vertices:
+            raise Exception(f'vertex "{starting_vertex}" not in graph')
+        elif destination_vertex not in self.vertices:
+            raise Exception(f'vertex "{destination_vertex}" not in graph')
+
+        for vertex, path in self._depth_first(starting_vertex):
+            if vertex == destination_vertex:
+                return list(path)
+        return None
+
+    def dfs_recursive(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing a path from
+        starting_vertex to destination_vertex in
+        depth-first order.
+
+        Explores in the same order as the recursive version, but keeps
+        the call frames on an explicit stack alongside the current path so
+        deep graphs cannot hit the recursion limit.
+        """
+        if starting_vertex not in self.vertices:
+            raise Exception(f'vertex "{starting_vertex}" not in graph')
+        elif destination_vertex not in self.vertices:
+            raise Exception(f'vertex "{destination_vertex}" not in graph')
+
+        if starting_vertex == destination_vertex:
+            return [starting_vertex]
+
+        visited = {starting_vertex}
+        cur_path = [starting_vertex]
+        frames = [iter(self.vertices[starting_vertex])]
+        while frames:
+            for vertex in frames[-1]:
+                if vertex not in visited:
+                    if vertex == destination_vertex:
+                        cur_path.append(vertex)
+                        return cur_path
+                    visited.add(vertex)
+                    cur_path.append(vertex)
+                    frames.append(iter(self.vertices[vertex]))
+                    break
+            else:
+                frames.pop()
+                cur_path.pop()
+        return None
+
+
+class GraphSnapshot(Graph):
+    """
+    Immutable view of a Graph at one version, returned by Graph.snapshot().
+    Supports every traversal and search; add_vertex and add_edge raise.
+    """
+    def __init__(self, vertices, predecessors, version):
+        super().__init__()
+        self.vertices = vertices
+        self.predecessors = predecessors
+        self.version = version
+
+    @classmethod
+    def from_edges(cls, edges, vertices=()):
+        raise Exception('graph snapshots are read-only')
+
+    def snapshot(self):
+        return self
+
+    def add_vertex(self, vertex_id):
+        raise Exception('graph snapshots are read-only')
+
+    def add_edge(self, v1, v2):
+        raise Exception('graph snapshots are read-only')
+
+
+class ChunkedMap(Mapping):
+    """
+    Read-only mapping stored as a list of dicts, with each key in the
+    dict at position hash(key) % len(chunks). Used for snapshot adjacency.
+    """
+    __slots__ = ('chunks', 'length')
+
+    def __init__(self, chunks, length):
+        self.chunks = chunks
+        self.length = length
+
+    def __getitem__(self, key):
+        return self.chunks[hash(key) % len(self.chunks)][key]
+
+    def __contains__(self, key):
+        return key in self.chunks[hash(key) % len(self.chunks)]
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+    def __len__(self):
+        return self.length
+
+
+class _CopyOnWriteMirror:
+    """
+    Chunked copy of one adjacency dict (vertices or predecessors) that
+    snapshots share. The graph's own dict is updated alongside it, so the
+    graph itself keeps plain dicts.
+    """
+    def __init__(self, adjacency):
+        self.adjacency = adjacency
+        self.chunks = [{} for _ in range(SNAPSHOT_CHUNKS)]
+        for key, neighbors in adjacency.items():
+            self.chunks[hash(key) % SNAPSHOT_CHUNKS][key] = neighbors
+        # Whether the latest snapshot shares the chunk list itself, and
+        # which chunks and neighbor sets were copied or created since it,
+        # so are no longer shared with any snapshot.
+        self.shared = False
+        self.owned_chunks = set()
+        self.owned_sets = set()
+
+    def freeze(self):
+        """
+        Return a ChunkedMap of the current contents and start sharing it.
+        """
+        self.shared = True
+        self.owned_chunks = set()
+        self.owned_sets = set()
+        return ChunkedMap(self.chunks, len(self.adjacency))
+
+    def _store(self, key, neighbors):
+        if self.shared:
+            self.chunks = list(self.chunks)
+            self.shared = False
+        i = hash(key) % SNAPSHOT_CHUNKS
+        if i not in self.owned_chunks:
+            self.chunks[i] = dict(self.chunks[i])
+            self.owned_chunks.add(i)
+        self.chunks[i][key] = neighbors
+        self.adjacency[key] = neighbors
+        self.owned_sets.add(key)
+
+    def add(self, key):
+        self._store(key, set())
+
+    def writable(self, key):
+        """
+        Return the neighbor set of key, first replacing it with a copy if
+        a snapshot may still share it.
+        """
+        if key not in self.owned_sets:
+            self._store(key, set(self.adjacency[key]))
+        return self.adjacency[key]
@@ -0,0 +1,155 @@
+"""
+Mutable graph over the integer vertices 0..n-1.
+
+Vertices are list positions rather than dict keys, so traversals track
+visited vertices in a bytearray (one byte per vertex, no hashing) and walk
+each neighbor set directly, without building the difference sets that
+Graph's iterators allocate at every step.
+"""
+
+
+class IndexedGraph:
+    """Represent a graph as a list of neighbor sets indexed by vertex."""
+    def __init__(self, num_vertices=0):
+        self.vertices = [set() for _ in range(num_vertices)]
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __contains__(self, vertex):
+        return isinstance(vertex, int) and 0 <= vertex < len(self.vertices)
+
+    @property
+    def num_edges(self):
+        return sum(len(neighbors) for neighbors in self.vertices)
+
+    def _check_vertex(self, vertex):
+        if vertex not in self:
+            raise Exception(f'vertex "{vertex}" not in graph')
+
+    def add_vertex(self):
+        """
+        Add a vertex to the graph and return its index.
+        """
+        self.vertices.append(set())
+        return len(self.vertices) - 1
+
+    def add_edge(self, v1, v2):
+        """
+        Add a directed edge to the graph.
+        """
+        self._check_vertex(v1)
+        self._check_vertex(v2)
+        self.vertices[v1].add(v2)
+
+    def get_neighbors(self, vertex_id):
+        """
+        Get all neighbors (edges) of a vertex.
+        """
+        self._check_vertex(vertex_id)
+        return list(self.vertices[vertex_id])
+
+    def breadth_first_iter(self, starting_vertex):
+        self._check_vertex(starting_vertex)
+        vertices = self.vertices
+        visited = bytearray(len(vertices))
+        visited[starting_vertex] = 1
+        # The visit order doubles as the queue: head walks it while new
+        # vertices are appended to the tail.
+        order = [starting_vertex]
+        head = 0
+        while head < len(order):
+            cur = order[head]
+            head += 1
+            yield cur
+            for vertex in vertices[cur]:
+                if not visited[vertex]:
+                    visited[vertex] = 1
+                    order.append(vertex)
+
+    def _depth_first(self, start):
+        """
+        Yield (vertex, stack) in depth-first preorder. The stack holds the
+        vertices from start to the yielded vertex.
+        """
+        vertices = self.vertices
+        visited = bytearray(len(vertices))
+        visited[start] = 1
+        stack = [start]
+        # One iterator over the remaining neighbors of each stacked vertex.
+        frames = [iter(vertices[start])]
+        yield start, stack
+        while frames:
+            for vertex in frames[-1]:
+                if not visited[vertex]:
+                    visited[vertex] = 1
+                    stack.append(vertex)
+                    frames.append(iter(vertices[vertex]))
+                    yield vertex, stack
+                    break
+            else:
+                stack.pop()
+                frames.pop()
+
+    def depth_first_stack_iter(self, starting_vertex):
+        self._check_vertex(starting_vertex)
+        for vertex, _ in self._depth_first(starting_vertex):
+            yield vertex
+
+    def bft(self, starting_vertex):
+        """
+        Print each vertex in breadth-first order
+        beginning from starting_vertex.
+        """
+        for vertex in self.breadth_first_iter(starting_vertex):
+            print(vertex)
+
+    def dft(self, starting_vertex):
+        """
+        Print each vertex in depth-first order
+        beginning from starting_vertex.
+        """
+        for vertex in self.depth_first_stack_iter(starting_vertex):
+            print(vertex)
+
+    def bfs(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing the shortest path from
+        starting_vertex to destination_vertex in
+        breath-first order.
+        """
+        self._check_vertex(starting_vertex)
+        self._check_vertex(destination_vertex)
+        vertices = self.vertices
+        # parents[v] == -1 marks v unvisited; the start is its own parent.
+        parents = [-1] * len(vertices)
+        parents[starting_vertex] = starting_vertex
+        order = [starting_vertex]
+        head = 0
+        while head < len(order):
+            cur = order[head]
+            head += 1
+            if cur == destination_vertex:
+                path = [cur]
+                while parents[path[-1]] != path[-1]:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return path
+            for vertex in vertices[cur]:
+                if parents[vertex] == -1:
+                    parents[vertex] = cur
+                    order.append(vertex)
+        return None
+
+    def dfs(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing a path from
+        starting_vertex to destination_vertex in
+        depth-first order.
+        """
+        self._check_vertex(starting_vertex)
+        self._check_vertex(destination_vertex)
+        for vertex, stack in self._depth_first(starting_vertex):
+            if vertex == destination_vertex:
+                return list(stack)
+        return None
@@ -0,0 +1,71 @@
+"""
+Array-based union-find (disjoint sets) over the integers 0..n-1.
+
+Each element's parent, rank and (for roots) component size live in flat
+machine-integer arrays. find() compresses paths and union() links by rank,
+so any sequence of operations runs in near-constant amortized time per
+operation.
+"""
+from array import array
+
+
+class UnionFind:
+    """Disjoint sets of the elements 0..n-1, merged with union()."""
+    def __init__(self, size=0):
+        self.parent = array('q', range(size))
+        self.rank = bytearray(size)
+        # Only meaningful at roots: the number of elements in the set.
+        self.sizes = array('q', [1]) * size
+        self.num_components = size
+
+    def __len__(self):
+        return len(self.parent)
+
+    def add(self):
+        """
+        Add a new element in a set of its own and return it.
+        """
+        element = len(self.parent)
+        self.parent.append(element)
+        self.rank.append(0)
+        self.sizes.append(1)
+        self.num_components += 1
+        return element
+
+    def find(self, element):
+        """
+        Return the root of element's set, pointing every element on the
+        way straight at it.
+        """
+        parent = self.parent
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+        return root
+
+    def union(self, a, b):
+        """
+        Merge the sets containing a and b. Returns False if they were
+        already the same set.
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        rank = self.rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        elif rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+        self.parent[root_b] = root_a
+        self.sizes[root_a] += self.sizes[root_b]
+        self.num_components -= 1
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def component_size(self, element):
+        return self.sizes[self.find(element)]
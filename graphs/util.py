@@ -1,17 +1,25 @@
+from collections import deque
 
-# Note: This Queue class is sub-optimal. Why?
+# Backed by a deque so enqueue and dequeue are both O(1); a list-backed
+# queue pays O(n) for every pop(0) and makes BFS quadratic in frontier size.
 class Queue():
-    def __init__(self):
-        self.queue = []
+    def __init__(self, values=()):
+        self.queue = deque(values)
     def enqueue(self, value):
         self.queue.append(value)
+    def extend(self, values):
+        self.queue.extend(values)
     def dequeue(self):
-        if self.size() > 0:
-            return self.queue.pop(0)
+        if self.queue:
+            return self.queue.popleft()
         else:
             return None
     def size(self):
         return len(self.queue)
+    def __len__(self):
+        return len(self.queue)
+    def __bool__(self):
+        return bool(self.queue)
 
 class Stack():
     def __init__(self):
@@ -25,4 +33,3 @@ class Stack():
             return None
     def size(self):
         return len(self.stack)
-
@@ -2,64 +2,71 @@ from room import Room
 from player import Player
 from world import World
 # from path_finder import find_path
-from pf2 import find_path
+# from pf2 import find_path
+from tree_solver import find_path
+# Uses every core for time_budget seconds (10 by default) to shorten the path.
+# Its worker processes import this module, which is why everything below
+# only runs when adv.py is the script being run:
+# from parallel_solver import find_path
 
 import random
-from ast import literal_eval
 
-# Load world
-world = World()
 
+if __name__ == '__main__':
+    # Load world
+    world = World()
 
-# You may uncomment the smaller graphs for development and testing purposes.
-# map_file = "maps/test_line.txt"
-# map_file = "maps/test_cross.txt"
-# map_file = "maps/test_loop.txt"
-# map_file = "maps/test_loop_fork.txt"
-map_file = "maps/main_maze.txt"
 
-# Loads the map into a dictionary
-room_graph=literal_eval(open(map_file, "r").read())
-world.load_graph(room_graph)
+    # You may uncomment the smaller graphs for development and testing purposes.
+    # Maps may also be in the line-oriented .rooms or packed .roomsb formats
+    # (see map_io.py).
+    # map_file = "maps/test_line.txt"
+    # map_file = "maps/test_cross.txt"
+    # map_file = "maps/test_loop.txt"
+    # map_file = "maps/test_loop_fork.txt"
+    map_file = "maps/main_maze.txt"
 
-# Print an ASCII map
-world.print_rooms()
+    # Streams the map into the world
+    world.load_file(map_file)
 
-player = Player(world.starting_room)
+    # Print an ASCII map
+    world.print_rooms()
 
-# Fill this out with directions to walk
-# traversal_path = ['n', 'n']
-traversal_path = []
+    player = Player(world.starting_room)
 
-traversal_path = find_path(world.starting_room)
+    # Fill this out with directions to walk
+    # traversal_path = ['n', 'n']
+    traversal_path = []
 
+    traversal_path = find_path(world.starting_room)
 
-# TRAVERSAL TEST
-visited_rooms = set()
-player.current_room = world.starting_room
-visited_rooms.add(player.current_room)
 
-for move in traversal_path:
-    player.travel(move)
+    # TRAVERSAL TEST
+    visited_rooms = set()
+    player.current_room = world.starting_room
     visited_rooms.add(player.current_room)
 
-if len(visited_rooms) == len(room_graph):
-    print(f"TESTS PASSED: {len(traversal_path)} moves, {len(visited_rooms)} rooms visited")
-else:
-    print("TESTS FAILED: INCOMPLETE TRAVERSAL")
-    print(f"{len(room_graph) - len(visited_rooms)} unvisited rooms")
-
-
-
-#######
-# UNCOMMENT TO WALK AROUND
-#######
-# player.current_room.print_room_description(player)
-# while True:
-#     cmds = input("-> ").lower().split(" ")
-#     if cmds[0] in ["n", "s", "e", "w"]:
-#         player.travel(cmds[0], True)
-#     elif cmds[0] == "q":
-#         break
-#     else:
-#         print("I did not understand that command.")
+    for move in traversal_path:
+        player.travel(move)
+        visited_rooms.add(player.current_room)
+
+    if len(visited_rooms) == world.num_rooms:
+        print(f"TESTS PASSED: {len(traversal_path)} moves, {len(visited_rooms)} rooms visited")
+    else:
+        print("TESTS FAILED: INCOMPLETE TRAVERSAL")
+        print(f"{world.num_rooms - len(visited_rooms)} unvisited rooms")
+
+
+
+    #######
+    # UNCOMMENT TO WALK AROUND
+    #######
+    # player.current_room.print_room_description(player)
+    # while True:
+    #     cmds = input("-> ").lower().split(" ")
+    #     if cmds[0] in ["n", "s", "e", "w"]:
+    #         player.travel(cmds[0], True)
+    #     elif cmds[0] == "q":
+    #         break
+    #     else:
+    #         print("I did not understand that command.")
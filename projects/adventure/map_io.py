@@ -0,0 +1,126 @@
+"""
+Readers and writers for adventure map files.
+
+Every reader yields room records (room_id, (x, y), exits) where exits maps
+a direction ('n', 's', 'e', 'w') to the connected room id - the same shape
+as the items of the room_graph dicts in maps/*.txt - so World.load_rooms
+can build rooms while the file is still being read.
+
+Supported formats, picked by file extension:
+    .txt     the original Python dict literal (parsed with literal_eval)
+    .rooms   one room per line: "id x y n s e w", '-' for a missing exit
+    .roomsb  packed binary: a header then one little-endian int32 record
+             (id, x, y, n, s, e, w) per room, -1 for a missing exit
+"""
+import os
+import struct
+from ast import literal_eval
+
+DIRECTIONS = ('n', 's', 'e', 'w')
+BINARY_MAGIC = b'ROOM'
+BINARY_HEADER = struct.Struct('<4sI')
+BINARY_RECORD = struct.Struct('<7i')
+
+
+def room_graph_records(room_graph):
+    """
+    Convert a room_graph dict ({id: [(x, y), exits]}) into room records.
+    """
+    for room_id, (coords, exits) in room_graph.items():
+        yield room_id, coords, exits
+
+
+def read_literal(path):
+    with open(path, 'r') as map_file:
+        room_graph = literal_eval(map_file.read())
+    yield from room_graph_records(room_graph)
+
+
+def read_lines(path):
+    with open(path, 'r') as map_file:
+        for line in map_file:
+            if not line.strip() or line.startswith('#'):
+                continue
+            room_id, x, y, *links = line.split()
+            exits = {
+                direction: int(link)
+                for direction, link in zip(DIRECTIONS, links)
+                if link != '-'
+            }
+            yield int(room_id), (int(x), int(y)), exits
+
+
+def read_binary(path, chunk_records=4096):
+    with open(path, 'rb') as map_file:
+        magic, num_rooms = BINARY_HEADER.unpack(map_file.read(BINARY_HEADER.size))
+        if magic != BINARY_MAGIC:
+            raise Exception(f'"{path}" is not a packed room file')
+        remaining = num_rooms
+        while remaining > 0:
+            count = min(chunk_records, remaining)
+            chunk = map_file.read(count * BINARY_RECORD.size)
+            if len(chunk) != count * BINARY_RECORD.size:
+                raise Exception(f'"{path}" is truncated')
+            for room_id, x, y, *links in BINARY_RECORD.iter_unpack(chunk):
+                exits = {
+                    direction: link
+                    for direction, link in zip(DIRECTIONS, links)
+                    if link >= 0
+                }
+                yield room_id, (x, y), exits
+            remaining -= count
+
+
+def write_lines(records, path):
+    with open(path, 'w') as map_file:
+        map_file.write('# id x y n s e w\n')
+        for room_id, (x, y), exits in records:
+            links = ' '.join(str(exits.get(direction, '-')) for direction in DIRECTIONS)
+            map_file.write(f'{room_id} {x} {y} {links}\n')
+
+
+def write_binary(records, path):
+    with open(path, 'wb') as map_file:
+        # The room count isn't known until records is exhausted, so the
+        # header is written again once it is.
+        map_file.write(BINARY_HEADER.pack(BINARY_MAGIC, 0))
+        num_rooms = 0
+        for room_id, (x, y), exits in records:
+            links = (exits.get(direction, -1) for direction in DIRECTIONS)
+            map_file.write(BINARY_RECORD.pack(room_id, x, y, *links))
+            num_rooms += 1
+        map_file.seek(0)
+        map_file.write(BINARY_HEADER.pack(BINARY_MAGIC, num_rooms))
+
+
+READERS = {
+    '.txt': read_literal,
+    '.rooms': read_lines,
+    '.roomsb': read_binary,
+}
+
+WRITERS = {
+    '.rooms': write_lines,
+    '.roomsb': write_binary,
+}
+
+
+def read_map(path):
+    """
+    Yield room records from a map file in any supported format.
+    """
+    extension = os.path.splitext(path)[1]
+    if extension not in READERS:
+        raise Exception(f'unknown map format "{extension}"')
+    return READERS[extension](path)
+
+
+def write_map(records, path):
+    """
+    Write room records (e.g. read_map output or room_graph_records) in
+    the format given by path's extension.
+    """
+    extension = os.path.splitext(path)[1]
+    if extension not in WRITERS:
+        raise Exception(f'cannot write map format "{extension}"')
+    WRITERS[extension](records, path)
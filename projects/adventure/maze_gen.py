@@ -0,0 +1,86 @@
+"""
+Seeded generator for large synthetic mazes.
+
+generate_maze returns a room_graph dict in the same shape as the maps in
+maps/ ({room_id: [(x, y), {direction: room_id}]}), so it can go straight
+into World.load_graph or be written out with map_io.write_map.
+
+The maze is grown on a grid from room 0: each step picks a random free
+cell next to an existing room and connects it to that room, which yields a
+random spanning tree. Afterwards every pair of grid-adjacent rooms that
+isn't connected yet gets a corridor with probability loop_density, adding
+loops.
+
+Usage:
+    python maze_gen.py 100000 --loops 0.05 --seed 1 -o maps/generated.roomsb
+"""
+import argparse
+import random
+
+from map_io import write_map, room_graph_records
+
+STEPS = {'n': (0, 1), 's': (0, -1), 'e': (1, 0), 'w': (-1, 0)}
+OPPOSITE = {'n': 's', 's': 'n', 'e': 'w', 'w': 'e'}
+
+
+def generate_maze(num_rooms, loop_density=0.0, seed=None):
+    """
+    Return a room_graph with num_rooms connected rooms. Coordinates are
+    shifted so the smallest x and y are both 0.
+    """
+    if num_rooms < 1:
+        raise Exception('a maze needs at least one room')
+    rng = random.Random(seed)
+    coords = [(0, 0)]
+    exits = [{}]
+    cell_rooms = {(0, 0): 0}
+    # (room_id, direction) pairs that may lead to a free cell. Entries go
+    # stale when the cell fills up and are skipped when drawn.
+    frontier = [(0, direction) for direction in STEPS]
+
+    while len(coords) < num_rooms:
+        # Swap a random entry to the end so removing it is O(1).
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        room_id, direction = frontier.pop()
+        x, y = coords[room_id]
+        dx, dy = STEPS[direction]
+        cell = (x + dx, y + dy)
+        if cell in cell_rooms:
+            continue
+        new_id = len(coords)
+        coords.append(cell)
+        exits.append({OPPOSITE[direction]: room_id})
+        exits[room_id][direction] = new_id
+        cell_rooms[cell] = new_id
+        frontier.extend((new_id, next_direction) for next_direction in STEPS)
+
+    if loop_density > 0:
+        for room_id, (x, y) in enumerate(coords):
+            # Looking only north and east considers each adjacent pair once.
+            for direction in ('n', 'e'):
+                dx, dy = STEPS[direction]
+                other_id = cell_rooms.get((x + dx, y + dy))
+                if other_id is not None and direction not in exits[room_id] \
+                        and rng.random() < loop_density:
+                    exits[room_id][direction] = other_id
+                    exits[other_id][OPPOSITE[direction]] = room_id
+
+    min_x = min(x for x, _ in coords)
+    min_y = min(y for _, y in coords)
+    return {
+        room_id: [(x - min_x, y - min_y), exits[room_id]]
+        for room_id, (x, y) in enumerate(coords)
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a random maze map file.')
+    parser.add_argument('num_rooms', type=int)
+    parser.add_argument('--loops', type=float, default=0.0,
+                        help='probability of a corridor between adjacent unconnected rooms')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('-o', '--output', required=True,
+                        help='map file to write (.rooms or .roomsb)')
+    args = parser.parse_args()
+    write_map(room_graph_records(generate_maze(args.num_rooms, args.loops, args.seed)), args.output)
@@ -0,0 +1,136 @@
+"""
+Randomized-restart traversal search across all cores.
+
+The greedy (pf2) and tree (tree_solver) walks both depend on the order in
+which a room's exits are tried. This module reruns them with many seeded
+random exit orders in a ProcessPoolExecutor and keeps the shortest path
+that verifiably visits every room.
+
+The world is shipped to each worker once, as a pickled RoomTable, when
+the worker starts; each task then only sends a seed and gets back a list
+of directions.
+"""
+import os
+import pickle
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, Optional
+
+import pf2
+import tree_solver
+from room import Room, RoomTable
+
+SOLVERS = (tree_solver.find_room_path, pf2.find_room_path)
+
+# The RoomTable each worker process searches, set by _init_worker.
+_room_table: Optional[RoomTable] = None
+
+
+def _init_worker(room_table_bytes: bytes):
+    global _room_table
+    _room_table = pickle.loads(room_table_bytes)
+
+
+def shuffled_neighbors(room_table: RoomTable, seed: int):
+    """
+    Return a neighbors function giving each room's exits in an order that
+    is random but fixed for the given seed. Seed 0 keeps the table's order.
+    """
+    if seed == 0:
+        return room_table.neighbors
+    rng = random.Random(seed)
+    orders = {}
+
+    def neighbors(room_id):
+        if room_id not in orders:
+            order = room_table.neighbors(room_id)
+            rng.shuffle(order)
+            orders[room_id] = order
+        return orders[room_id]
+
+    return neighbors
+
+
+def solve_seed(room_table: RoomTable, starting_room: int, seed: int) -> List[str]:
+    """
+    Run one randomized variant: seeds alternate between the solvers, and
+    each solver's first run (seeds 0 and 1) keeps the table's exit order.
+    """
+    solver = SOLVERS[seed % len(SOLVERS)]
+    neighbors = shuffled_neighbors(room_table, seed // len(SOLVERS))
+    return pf2.rooms_to_directions(solver(starting_room, neighbors), room_table)
+
+
+def _solve_in_worker(starting_room: int, seed: int) -> List[str]:
+    return solve_seed(_room_table, starting_room, seed)
+
+
+def verify(room_table: RoomTable, starting_room: int, traversal_path: List[str], num_rooms: int) -> bool:
+    """
+    Walk traversal_path and check it visits num_rooms distinct rooms.
+    """
+    cur_room = starting_room
+    visited = {cur_room}
+    for direction in traversal_path:
+        cur_room = room_table.get_room_in_direction(cur_room, direction)
+        if cur_room is None:
+            return False
+        visited.add(cur_room)
+    return len(visited) == num_rooms
+
+
+def find_path(
+        starting_room: Room,
+        room_table: Optional[RoomTable] = None,
+        time_budget: float = 10.0,
+        max_restarts: Optional[int] = None,
+        max_workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Return the shortest verified traversal found by randomized restarts
+    within time_budget seconds (or max_restarts runs, if that comes first).
+    With a room_table, starting_room is a room id in that table; otherwise
+    a table is built from the rooms reachable from starting_room.
+
+    The deterministic runs (seeds 0 and 1) are always submitted first, so
+    the result is never worse than tree_solver or pf2 alone as long as the
+    budget allows them to finish.
+    """
+    if room_table is None:
+        rooms = pf2.build_graph_set(starting_room)
+        room_table = RoomTable.from_rooms({room.id: room for room in rooms})
+        starting_room = starting_room.id
+    num_rooms = len(pf2.build_graph_set(starting_room, room_table.neighbors))
+    max_workers = max_workers or os.cpu_count() or 1
+    deadline = time.monotonic() + time_budget
+
+    best: Optional[List[str]] = None
+    next_seed = 0
+    pending = set()
+    with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(pickle.dumps(room_table),),
+    ) as executor:
+        while True:
+            # Keep every worker busy with one queued task behind it.
+            while len(pending) < 2 * max_workers and time.monotonic() < deadline \
+                    and (max_restarts is None or next_seed < max_restarts):
+                pending.add(executor.submit(_solve_in_worker, starting_room, next_seed))
+                next_seed += 1
+            if not pending:
+                break
+            # Past the deadline without any result, wait for the first one.
+            timeout = max(0.0, deadline - time.monotonic()) if best is not None else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                traversal_path = future.result()
+                if (best is None or len(traversal_path) < len(best)) \
+                        and verify(room_table, starting_room, traversal_path, num_rooms):
+                    best = traversal_path
+            if time.monotonic() >= deadline and best is not None:
+                for future in pending:
+                    future.cancel()
+                break
+    return best
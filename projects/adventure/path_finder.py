@@ -1,7 +1,6 @@
 from typing import Set, Dict, List
 
-from graph import Graph
-from util import Queue
+from graphs import Graph, Queue
 from room import Room
 
 def find_path(starting_room: Room):
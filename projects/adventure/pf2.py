@@ -1,79 +1,101 @@
-from typing import List, Dict, Set
-
-from room import Room
-from util import Queue
-
-def find_path(starting_room: Room) -> List[str]:
+from typing import Callable, List, Dict, Optional, Set
+
+from room import Room, RoomTable
+from graphs import Queue
+
+def room_neighbors(room: Room) -> List[Room]:
+    return [room.get_room_in_direction(direction) for direction in room.get_exits()]
+
+class TraversalFrontier:
+    """
+    Incrementally maintained walk state: the visited rooms and how many
+    rooms are still unvisited. visit() updates both in O(1), and
+    nearest_unvisited is a breadth-first search from the current room
+    that stops at the first match, so its cost depends on the search
+    radius rather than on the size of the maze.
+
+    Rooms can be Room objects or RoomTable ids; neighbors maps a room to
+    the rooms connected to it.
+    """
+    def __init__(self, rooms: Set[Room], neighbors: Callable = room_neighbors):
+        self.neighbors = neighbors
+        self.visited: Set[Room] = set()
+        self.num_unvisited = len(rooms)
+
+    def visit(self, room: Room):
+        if room in self.visited:
+            return
+        self.visited.add(room)
+        self.num_unvisited -= 1
+
+    def _search(self, starting_room: Room, is_target) -> List[Room]:
+        """
+        Return the rooms after starting_room on the shortest route to the
+        nearest room for which is_target(room) is true, or [].
+        """
+        neighbors = self.neighbors
+        parents: Dict[Room, Room] = {starting_room: None}
+        need_to_visit = Queue()
+        need_to_visit.enqueue(starting_room)
+        while need_to_visit:
+            cur_room: Room = need_to_visit.dequeue()
+            if cur_room != starting_room and is_target(cur_room):
+                route = [cur_room]
+                while parents[route[-1]] != starting_room:
+                    route.append(parents[route[-1]])
+                route.reverse()
+                return route
+            for room in neighbors(cur_room):
+                if room not in parents:
+                    parents[room] = cur_room
+                    need_to_visit.enqueue(room)
+        return []
+
+    def nearest_unvisited(self, starting_room: Room) -> List[Room]:
+        """
+        Return the rooms after starting_room on the shortest route to the
+        nearest unvisited room, or [] if every reachable room is visited.
+        """
+        visited = self.visited
+        return self._search(starting_room, lambda room: room not in visited)
+
+def find_path(starting_room: Room, room_table: Optional[RoomTable] = None) -> List[str]:
+    """
+    Return directions that visit every room reachable from starting_room.
+    With a room_table, starting_room is a room id in that table.
+    """
+    neighbors = room_neighbors if room_table is None else room_table.neighbors
+    return rooms_to_directions(find_room_path(starting_room, neighbors), room_table)
+
+def find_room_path(starting_room: Room, neighbors: Callable = room_neighbors) -> List[Room]:
+    """
+    Return the rooms of a walk visiting every room reachable from
+    starting_room. Ties between equally near rooms follow neighbors order.
+    """
     raw_path: List[Room] = [starting_room]
-    visited: Set[Room] = set([starting_room])
-    rooms_set = build_graph_set(starting_room)
-    shortest_routes: Dict[Room, Dict[Room, List[Room]]] = {
-        room: get_shortest_routes(room) for room in rooms_set
-    }
+    frontier = TraversalFrontier(build_graph_set(starting_room, neighbors), neighbors)
+    frontier.visit(starting_room)
 
     cur_room: Room = starting_room
-    while len(rooms_set.difference(visited)) > 0:
-        raw_path.extend(get_path_to_nearest_dead_end(cur_room, shortest_routes, visited))
-        cur_room = raw_path[-1]
-        visited.add(cur_room)
-        raw_path.extend(get_path_to_nearest_unvisited(cur_room, shortest_routes, visited))
+    while frontier.num_unvisited > 0:
+        route = frontier.nearest_unvisited(cur_room)
+        for room in route:
+            frontier.visit(room)
+        raw_path.extend(route)
         cur_room = raw_path[-1]
-        visited.add(cur_room)
-
-
-    directional_path: List[str] = convert_rooms_path_to_direcctional(raw_path)
-
-    return directional_path
 
-def get_path_to_nearest_dead_end(
-        starting_room: Room,
-        shortest_routes: Dict[Room, Dict[Room, List[Room]]],
-        visited: Set[Room],
-) -> List[Room]:
-    for cur_path in shortest_routes[starting_room].values():
-        cur_visited = visited.copy().union(set(cur_path))
-        cur_room = cur_path[-1]
-        if cur_room not in cur_visited and is_dead_end(cur_room, cur_visited):
-            return cur_path[1 : ]
-    return []
-
-def is_dead_end(room: Room, visited: Set[Room]):
-    for direction in room.get_exits():
-        if room.get_room_in_direction(direction) not in visited:
-            return False
-    return True
-
-def get_path_to_nearest_unvisited(
-        starting_room: Room,
-        shortest_routes: Dict[Room, Dict[Room, List[Room]]],
-        visited: Set[Room]
-) -> List[Room]:
-    for cur_path in shortest_routes[starting_room].values():
-        cur_room = cur_path[-1]
-        if cur_room not in visited:
-            return cur_path[1 : ]
-    return []
-
-def get_shortest_routes(starting_room):
-    shortest_routes: Dict[Room, List[Room]] = {}
-    need_to_visit = Queue()
-    visited: Set[Room] = set()
+    return raw_path
 
-    need_to_visit.enqueue([starting_room])
-    while need_to_visit.size() > 0:
-        cur_path: List[Room] = need_to_visit.dequeue()
-        cur_room = cur_path[-1]
-        shortest_routes[cur_room] = tuple(cur_path)
-        visited.add(cur_room)
-
-        for direction in cur_room.get_exits():
-            room: Room = cur_room.get_room_in_direction(direction)
-            if room not in visited:
-                next_path = cur_path.copy()
-                next_path.append(room)
-                need_to_visit.enqueue(next_path)
-
-    return shortest_routes
+def rooms_to_directions(raw_path: List[Room], room_table: Optional[RoomTable] = None) -> List[str]:
+    """
+    Convert a walk given as rooms (or room_table ids) into directions.
+    """
+    if room_table is not None:
+        return [
+            room_table.direction_between(room, next_room)
+            for room, next_room in zip(raw_path, raw_path[1:])
+        ]
+    return convert_rooms_path_to_direcctional(raw_path)
 
 def convert_rooms_path_to_direcctional(raw_path: List[Room]):
     directional_path: List[str] = []
@@ -91,18 +113,17 @@ def convert_rooms_path_to_direcctional(raw_path: List[Room]):
         room = next_room
     return directional_path
 
-def build_graph_set(starting_room: Room) -> Set[Room]:
+def build_graph_set(starting_room: Room, neighbors: Callable = room_neighbors) -> Set[Room]:
     need_to_visit = Queue()
-    visited: Set[Room] = set()
+    visited: Set[Room] = set([starting_room])
 
     need_to_visit.enqueue(starting_room)
 
     while need_to_visit.size() > 0:
         cur_room: Room = need_to_visit.dequeue()
-        visited.add(cur_room)
-        for direction in cur_room.get_exits():
-            room = cur_room.get_room_in_direction(direction)
+        for room in neighbors(cur_room):
             if room not in visited:
+                visited.add(room)
                 need_to_visit.enqueue(room)
 
     return visited
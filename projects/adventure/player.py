@@ -1,11 +1,19 @@
 class Player:
-    def __init__(self, starting_room):
+    def __init__(self, starting_room, room_table=None):
+        # With a room_table, rooms are integer ids into it instead of Rooms.
         self.current_room = starting_room
+        self.room_table = room_table
     def travel(self, direction, show_rooms = False):
-        next_room = self.current_room.get_room_in_direction(direction)
+        if self.room_table is not None:
+            next_room = self.room_table.get_room_in_direction(self.current_room, direction)
+        else:
+            next_room = self.current_room.get_room_in_direction(direction)
         if next_room is not None:
             self.current_room = next_room
             if (show_rooms):
-                next_room.print_room_description(self)
+                if self.room_table is not None:
+                    print(self.room_table.describe(next_room))
+                else:
+                    next_room.print_room_description(self)
         else:
             print("You cannot move in that direction.")
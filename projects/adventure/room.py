@@ -1,6 +1,11 @@
+from array import array
+
 # Implement a class to hold room information. This should have name and
 # description attributes.
 class Room:
+    # No per-instance __dict__: large worlds hold hundreds of thousands of rooms.
+    __slots__ = ('id', 'name', 'description', 'n_to', 's_to', 'e_to', 'w_to', 'x', 'y')
+
     def __init__(self, name, description, id=0, x=None, y=None):
         self.id = id
         self.name = name
@@ -65,3 +70,100 @@ class Room:
 
     def get_coords(self):
         return [self.x, self.y]
+
+
+class RoomTable:
+    """
+    Struct-of-arrays room storage for large worlds. Rooms are plain integer
+    ids 0..n-1; coordinates live in the int32 arrays x and y, and exits in
+    the int32 array links, indexed by room_id * 4 + DIRECTIONS.index(d)
+    with -1 for no exit. Costs 24 bytes per room, with no Room objects.
+    """
+    DIRECTIONS = ('n', 's', 'e', 'w')
+    DIRECTION_INDEX = {direction: i for i, direction in enumerate(DIRECTIONS)}
+    OPPOSITE = {'n': 's', 's': 'n', 'e': 'w', 'w': 'e'}
+    # Same order as Room.get_exits, so traversals visit rooms identically.
+    EXIT_ORDER = ((0, 'n'), (1, 's'), (3, 'w'), (2, 'e'))
+
+    def __init__(self):
+        self.x = array('i')
+        self.y = array('i')
+        self.links = array('i')
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build a table in one pass over (room_id, (x, y), exits) records, as
+        produced by map_io.read_map.
+        """
+        table = cls()
+        for room_id, (x, y), exits in records:
+            table._reserve(room_id)
+            table.x[room_id] = x
+            table.y[room_id] = y
+            for direction, other_id in exits.items():
+                table._reserve(other_id)
+                table.connect_rooms(room_id, direction, other_id)
+        return table
+
+    @classmethod
+    def from_rooms(cls, rooms):
+        """
+        Build a table from a dict of room_id -> Room (World.rooms).
+        """
+        return cls.from_records(
+            (room_id, (room.x, room.y), {
+                direction: room.get_room_in_direction(direction).id
+                for direction in room.get_exits()
+            })
+            for room_id, room in rooms.items()
+        )
+
+    def _reserve(self, room_id):
+        missing = room_id + 1 - len(self.x)
+        if missing > 0:
+            self.x.extend(array('i', [0]) * missing)
+            self.y.extend(array('i', [0]) * missing)
+            self.links.extend(array('i', [-1]) * (4 * missing))
+
+    def __len__(self):
+        return len(self.x)
+
+    def connect_rooms(self, room_id, direction, connecting_room_id):
+        self.links[room_id * 4 + self.DIRECTION_INDEX[direction]] = connecting_room_id
+        self.links[connecting_room_id * 4 + self.DIRECTION_INDEX[self.OPPOSITE[direction]]] = room_id
+
+    def get_room_in_direction(self, room_id, direction):
+        if direction not in self.DIRECTION_INDEX:
+            return None
+        other_id = self.links[room_id * 4 + self.DIRECTION_INDEX[direction]]
+        return other_id if other_id >= 0 else None
+
+    def get_exits(self, room_id):
+        base = room_id * 4
+        return [direction for i, direction in self.EXIT_ORDER if self.links[base + i] >= 0]
+
+    def neighbors(self, room_id):
+        """
+        Ids of the rooms connected to room_id, in get_exits order.
+        """
+        links = self.links
+        base = room_id * 4
+        return [links[base + i] for i, _ in self.EXIT_ORDER if links[base + i] >= 0]
+
+    def direction_between(self, room_id, next_room_id):
+        base = room_id * 4
+        for i, direction in enumerate(self.DIRECTIONS):
+            if self.links[base + i] == next_room_id:
+                return direction
+        return None
+
+    def get_coords(self, room_id):
+        return [self.x[room_id], self.y[room_id]]
+
+    def describe(self, room_id):
+        """
+        The text Room.__str__ would give for this room.
+        """
+        return f"\n-------------------\n\nRoom {room_id}\n\n   ({self.x[room_id]},{self.y[room_id]})\n\n\
+            Exits: [{', '.join(self.get_exits(room_id))}]\n"
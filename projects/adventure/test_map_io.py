@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+from map_io import read_map, write_map, room_graph_records
+from world import World
+from player import Player
+from pf2 import find_path
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.room_graph = {
+            0: [(3, 5), {'n': 1, 'e': 3}],
+            1: [(3, 6), {'s': 0, 'n': 2}],
+            2: [(3, 7), {'s': 1}],
+            3: [(4, 5), {'w': 0}],
+        }
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        records = list(room_graph_records(self.room_graph))
+        for extension in ('.rooms', '.roomsb'):
+            path = os.path.join(self.tmp_dir.name, f'map{extension}')
+            write_map(room_graph_records(self.room_graph), path)
+            self.assertEqual(list(read_map(path)), records)
+
+    def test_load_file(self):
+        path = os.path.join(self.tmp_dir.name, 'map.roomsb')
+        write_map(room_graph_records(self.room_graph), path)
+        world = World()
+        world.load_file(path)
+        self.assertEqual(len(world.rooms), 4)
+        self.assertIs(world.starting_room.n_to, world.rooms[1])
+        self.assertIs(world.rooms[3].w_to, world.starting_room)
+        self.assertIs(world.room_grid[(3, 7)], world.rooms[2])
+        self.assertEqual(world.rooms[2].get_coords(), [3, 7])
+
+    def test_load_file_compact(self):
+        path = os.path.join(self.tmp_dir.name, 'map.rooms')
+        write_map(room_graph_records(self.room_graph), path)
+        world = World()
+        world.load_file(path, compact=True)
+        table = world.room_table
+        self.assertEqual(world.num_rooms, 4)
+        self.assertEqual(table.get_exits(0), ['n', 'e'])
+        self.assertEqual(table.get_room_in_direction(1, 'n'), 2)
+        self.assertIsNone(table.get_room_in_direction(2, 'n'))
+        self.assertEqual(table.get_coords(3), [4, 5])
+
+        player = Player(world.starting_room, table)
+        visited = {player.current_room}
+        for move in find_path(world.starting_room, table):
+            player.travel(move)
+            visited.add(player.current_room)
+        self.assertEqual(visited, {0, 1, 2, 3})
+
+if __name__ == '__main__':
+    unittest.main()
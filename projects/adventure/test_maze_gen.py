@@ -0,0 +1,46 @@
+import unittest
+from maze_gen import generate_maze, STEPS, OPPOSITE
+from world import World
+from tree_solver import find_path
+from player import Player
+
+class Test(unittest.TestCase):
+    def check_maze(self, room_graph, num_rooms):
+        self.assertEqual(sorted(room_graph), list(range(num_rooms)))
+        cells = set()
+        for room_id, ((x, y), exits) in room_graph.items():
+            self.assertGreaterEqual(min(x, y), 0)
+            cells.add((x, y))
+            for direction, other_id in exits.items():
+                other_x, other_y = room_graph[other_id][0]
+                self.assertEqual((other_x - x, other_y - y), STEPS[direction])
+                self.assertEqual(room_graph[other_id][1][OPPOSITE[direction]], room_id)
+        self.assertEqual(len(cells), num_rooms)
+
+    def test_tree_maze(self):
+        room_graph = generate_maze(500, seed=3)
+        self.check_maze(room_graph, 500)
+        num_corridors = sum(len(exits) for _, exits in room_graph.values()) // 2
+        self.assertEqual(num_corridors, 499)
+
+    def test_loop_density(self):
+        room_graph = generate_maze(500, loop_density=0.5, seed=3)
+        self.check_maze(room_graph, 500)
+        num_corridors = sum(len(exits) for _, exits in room_graph.values()) // 2
+        self.assertGreater(num_corridors, 550)
+
+    def test_seeded(self):
+        self.assertEqual(generate_maze(200, 0.1, seed=9), generate_maze(200, 0.1, seed=9))
+
+    def test_traversable(self):
+        world = World()
+        world.load_graph(generate_maze(2000, loop_density=0.05, seed=1))
+        player = Player(world.starting_room)
+        visited_rooms = {player.current_room}
+        for move in find_path(world.starting_room):
+            player.travel(move)
+            visited_rooms.add(player.current_room)
+        self.assertEqual(len(visited_rooms), 2000)
+
+if __name__ == '__main__':
+    unittest.main()
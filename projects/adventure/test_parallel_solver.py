@@ -0,0 +1,34 @@
+import os
+import unittest
+from world import World
+import parallel_solver
+import tree_solver
+
+MAPS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
+
+class Test(unittest.TestCase):
+    def test_find_path(self):
+        world = World()
+        world.load_file(os.path.join(MAPS_DIR, "test_loop_fork.txt"), compact=True)
+        table = world.room_table
+        traversal_path = parallel_solver.find_path(
+            world.starting_room, table, time_budget=5, max_restarts=20, max_workers=2,
+        )
+        self.assertTrue(parallel_solver.verify(table, world.starting_room, traversal_path, world.num_rooms))
+        self.assertLessEqual(len(traversal_path), len(tree_solver.find_path(world.starting_room, table)))
+
+    def test_solve_seed_is_deterministic(self):
+        world = World()
+        world.load_file(os.path.join(MAPS_DIR, "main_maze.txt"), compact=True)
+        table = world.room_table
+        self.assertEqual(
+            parallel_solver.solve_seed(table, world.starting_room, 0),
+            tree_solver.find_path(world.starting_room, table),
+        )
+        self.assertEqual(
+            parallel_solver.solve_seed(table, world.starting_room, 7),
+            parallel_solver.solve_seed(table, world.starting_room, 7),
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import unittest
+from ast import literal_eval
+from world import World
+from player import Player
+from pf2 import TraversalFrontier, find_path
+
+MAPS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        '''
+        3 - 1 - 0 - 2 - 4
+                    |
+                    5
+        '''
+        self.exits = {0: [1, 2], 1: [0, 3], 2: [0, 4, 5], 3: [1], 4: [2], 5: [2]}
+        self.frontier = TraversalFrontier(set(self.exits), self.exits.__getitem__)
+
+    def walk(self, map_name):
+        with open(os.path.join(MAPS_DIR, f"{map_name}.txt")) as map_file:
+            room_graph = literal_eval(map_file.read())
+        world = World()
+        world.load_graph(room_graph)
+        traversal_path = find_path(world.starting_room)
+        player = Player(world.starting_room)
+        visited_rooms = {player.current_room}
+        for move in traversal_path:
+            player.travel(move)
+            visited_rooms.add(player.current_room)
+        self.assertEqual(len(visited_rooms), len(room_graph))
+        return traversal_path
+
+    def test_find_path(self):
+        self.assertEqual(len(self.walk("test_line")), 2)
+        self.assertEqual(len(self.walk("test_cross")), 14)
+        self.assertEqual(len(self.walk("test_loop")), 14)
+        self.assertEqual(len(self.walk("test_loop_fork")), 26)
+
+    def test_find_path_main_maze(self):
+        self.assertEqual(len(self.walk("main_maze")), 997)
+
+    def test_visit_counts(self):
+        self.assertEqual(self.frontier.num_unvisited, 6)
+        self.frontier.visit(0)
+        self.frontier.visit(2)
+        self.frontier.visit(0)
+        self.assertEqual(self.frontier.num_unvisited, 4)
+        self.assertSetEqual(self.frontier.visited, {0, 2})
+
+    def test_nearest_unvisited_ties(self):
+        self.frontier.visit(0)
+        # 1 and 2 are both one move away; the first exit listed wins.
+        self.assertListEqual(self.frontier.nearest_unvisited(0), [1])
+        self.frontier.visit(1)
+        self.frontier.visit(3)
+        self.assertListEqual(self.frontier.nearest_unvisited(3), [1, 0, 2])
+        self.frontier.visit(2)
+        # 4 and 5 are both one move from 2.
+        self.assertListEqual(self.frontier.nearest_unvisited(2), [4])
+
+    def test_nearest_unvisited_when_all_visited(self):
+        for room in self.exits:
+            self.frontier.visit(room)
+        self.assertEqual(self.frontier.num_unvisited, 0)
+        self.assertListEqual(self.frontier.nearest_unvisited(4), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import unittest
+from world import World
+from player import Player
+from pf2 import find_path as greedy_find_path
+from tree_solver import find_path
+
+MAPS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
+MAPS = ["test_line", "test_cross", "test_loop", "test_loop_fork", "main_maze"]
+
+class Test(unittest.TestCase):
+    def walk(self, map_name, compact=False):
+        world = World()
+        world.load_file(os.path.join(MAPS_DIR, f"{map_name}.txt"), compact=compact)
+        room_table = world.room_table
+        traversal_path = find_path(world.starting_room, room_table)
+        player = Player(world.starting_room, room_table)
+        visited_rooms = {player.current_room}
+        for move in traversal_path:
+            player.travel(move)
+            visited_rooms.add(player.current_room)
+        self.assertEqual(len(visited_rooms), world.num_rooms)
+        return traversal_path
+
+    def test_visits_every_room(self):
+        for map_name in MAPS:
+            self.walk(map_name)
+
+    def test_tree_is_optimal(self):
+        # Trees need 2 * (rooms - 1) - depth of the last room.
+        self.assertEqual(len(self.walk("test_line")), 2)
+        self.assertEqual(len(self.walk("test_cross")), 14)
+
+    def test_compact_matches(self):
+        self.assertEqual(self.walk("main_maze", compact=True), self.walk("main_maze"))
+
+    def test_never_longer_than_greedy(self):
+        for map_name in MAPS:
+            world = World()
+            world.load_file(os.path.join(MAPS_DIR, f"{map_name}.txt"))
+            self.assertLessEqual(len(self.walk(map_name)), len(greedy_find_path(world.starting_room)))
+        # Loops where the greedy walk is the shorter one.
+        self.assertEqual(len(self.walk("test_loop")), 14)
+        self.assertEqual(len(self.walk("test_loop_fork")), 26)
+
+    def test_beats_greedy(self):
+        world = World()
+        world.load_file(os.path.join(MAPS_DIR, "main_maze.txt"))
+        self.assertLess(len(self.walk("main_maze")), len(greedy_find_path(world.starting_room)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+"""
+Traversal solver for mazes that are mostly trees.
+
+A walk that visits every room of a tree and may stop anywhere needs
+2 * (rooms - 1) - depth moves, where depth is how far from the start it
+stops, so the best walk explores every branch and leaves the deepest
+branch for last. This solver:
+
+    1. builds a spanning tree from the starting room,
+    2. orders each room's children by subtree height, deepest last,
+    3. walks the tree in that depth-first order.
+
+When the maze has loops, the tree ignores some corridors. Moving between
+two consecutive rooms of the order then uses a bounded breadth-first
+search, which takes a loop corridor whenever that beats backtracking
+through the tree, and both a breadth-first and a depth-first spanning
+tree are tried. Small loops can still favor pf2's greedy nearest-room
+walk, so that walk is tried too and the shortest of the three is kept.
+On a pure tree each step just follows the tree, so the whole solve is
+O(rooms).
+"""
+from typing import Callable, Dict, List, Optional
+
+from room import Room, RoomTable
+import pf2
+from pf2 import room_neighbors, rooms_to_directions
+from graphs import Queue
+
+
+def breadth_first_spanning_tree(starting_room: Room, neighbors: Callable):
+    """
+    Return (parents, depths, order) for a breadth-first spanning tree.
+    order lists the rooms in breadth-first order.
+    """
+    parents: Dict[Room, Room] = {starting_room: None}
+    depths: Dict[Room, int] = {starting_room: 0}
+    order: List[Room] = [starting_room]
+    for cur_room in order:
+        for room in neighbors(cur_room):
+            if room not in parents:
+                parents[room] = cur_room
+                depths[room] = depths[cur_room] + 1
+                order.append(room)
+    return parents, depths, order
+
+
+def depth_first_spanning_tree(starting_room: Room, neighbors: Callable):
+    """
+    Return (parents, depths, order) for a depth-first spanning tree, which
+    follows a loop all the way around instead of splitting it in two.
+    order lists the rooms in depth-first preorder.
+    """
+    parents: Dict[Room, Room] = {starting_room: None}
+    depths: Dict[Room, int] = {starting_room: 0}
+    order: List[Room] = [starting_room]
+    stack = [starting_room]
+    frames = [iter(neighbors(starting_room))]
+    while frames:
+        for room in frames[-1]:
+            if room not in parents:
+                parents[room] = stack[-1]
+                depths[room] = depths[stack[-1]] + 1
+                order.append(room)
+                stack.append(room)
+                frames.append(iter(neighbors(room)))
+                break
+        else:
+            stack.pop()
+            frames.pop()
+    return parents, depths, order
+
+
+def deepest_last_order(starting_room: Room, parents, order) -> List[Room]:
+    """
+    Depth-first preorder of the spanning tree in which every room's
+    children are explored in order of increasing subtree height.
+    """
+    heights: Dict[Room, int] = {room: 0 for room in order}
+    children: Dict[Room, List[Room]] = {room: [] for room in order}
+    for room in reversed(order):
+        parent = parents[room]
+        if parent is not None:
+            children[parent].append(room)
+            heights[parent] = max(heights[parent], heights[room] + 1)
+
+    preorder: List[Room] = []
+    stack = [starting_room]
+    while stack:
+        room = stack.pop()
+        preorder.append(room)
+        # The stack pops the last pushed child first, so push deepest first.
+        stack.extend(sorted(children[room], key=heights.get, reverse=True))
+    return preorder
+
+
+def tree_route(source: Room, target: Room, parents, depths) -> List[Room]:
+    """
+    Rooms after source on the tree path from source to target.
+    """
+    up: List[Room] = []
+    down: List[Room] = []
+    while depths[source] > depths[target]:
+        source = parents[source]
+        up.append(source)
+    while depths[target] > depths[source]:
+        down.append(target)
+        target = parents[target]
+    while source != target:
+        source = parents[source]
+        up.append(source)
+        down.append(target)
+        target = parents[target]
+    down.reverse()
+    return up + down
+
+
+def shortest_route(source: Room, target: Room, neighbors: Callable, max_length: int) -> Optional[List[Room]]:
+    """
+    Rooms after source on a shortest route to target, searching no
+    further than max_length moves. Returns None if there's no such route.
+    """
+    parents: Dict[Room, Room] = {source: None}
+    depths: Dict[Room, int] = {source: 0}
+    need_to_visit = Queue()
+    need_to_visit.enqueue(source)
+    while need_to_visit:
+        cur_room = need_to_visit.dequeue()
+        if cur_room == target:
+            route = [cur_room]
+            while parents[route[-1]] != source:
+                route.append(parents[route[-1]])
+            route.reverse()
+            return route
+        if depths[cur_room] == max_length:
+            continue
+        for room in neighbors(cur_room):
+            if room not in parents:
+                parents[room] = cur_room
+                depths[room] = depths[cur_room] + 1
+                need_to_visit.enqueue(room)
+    return None
+
+
+def walk_tree(starting_room: Room, neighbors: Callable, tree, has_loops: bool) -> List[Room]:
+    """
+    Return the rooms of a walk visiting every room of the spanning tree,
+    deepest branches last.
+    """
+    parents, depths, order = tree
+    raw_path: List[Room] = [starting_room]
+    visited = {starting_room}
+    cur_room = starting_room
+    for target in deepest_last_order(starting_room, parents, order):
+        if target in visited:
+            continue
+        route = tree_route(cur_room, target, parents, depths)
+        if has_loops and len(route) > 1:
+            route = shortest_route(cur_room, target, neighbors, len(route) - 1) or route
+        visited.update(route)
+        raw_path.extend(route)
+        cur_room = target
+    return raw_path
+
+
+def find_path(starting_room: Room, room_table: Optional[RoomTable] = None) -> List[str]:
+    """
+    Return directions that visit every room reachable from starting_room.
+    With a room_table, starting_room is a room id in that table.
+
+    On a maze with loops, walks both the breadth-first and the depth-first
+    spanning tree, and the pf2 greedy walk, and keeps the shortest, so it
+    is never longer than pf2.find_path.
+    """
+    neighbors = room_neighbors if room_table is None else room_table.neighbors
+    return rooms_to_directions(find_room_path(starting_room, neighbors), room_table)
+
+
+def find_room_path(starting_room: Room, neighbors: Callable = room_neighbors) -> List[Room]:
+    """
+    Return the rooms of the find_path walk. Ties between equally tall
+    subtrees and between spanning trees follow neighbors order.
+    """
+    tree = breadth_first_spanning_tree(starting_room, neighbors)
+    num_corridors = sum(len(neighbors(room)) for room in tree[2]) // 2
+    has_loops = num_corridors > len(tree[2]) - 1
+
+    raw_path = walk_tree(starting_room, neighbors, tree, has_loops)
+    if has_loops:
+        tree = depth_first_spanning_tree(starting_room, neighbors)
+        raw_path = min(
+            raw_path,
+            walk_tree(starting_room, neighbors, tree, has_loops),
+            pf2.find_room_path(starting_room, neighbors),
+            key=len,
+        )
+    return raw_path
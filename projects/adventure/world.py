@@ -1,4 +1,5 @@
-from room import Room
+from room import Room, RoomTable
+from map_io import read_map, room_graph_records
 import random
 import math
 
@@ -6,41 +7,76 @@ class World:
     def __init__(self):
         self.starting_room = None
         self.rooms = {}
-        self.room_grid = []
+        # Sparse grid: (x, y) -> room, only for coordinates holding a room.
+        self.room_grid = {}
         self.grid_size = 0
+        # Set instead of rooms/room_grid when loaded with compact=True.
+        self.room_table = None
+
+    @property
+    def num_rooms(self):
+        if self.room_table is not None:
+            return len(self.room_table)
+        return len(self.rooms)
+
     def load_graph(self, room_graph):
-        num_rooms = len(room_graph)
-        rooms = [None] * num_rooms
+        self.load_rooms(room_graph_records(room_graph))
+
+    def load_file(self, map_file, compact=False):
+        """
+        Stream rooms from a map file in any format map_io can read.
+
+        With compact=True the rooms are kept only in a RoomTable; the
+        starting room and every room are then integer ids, to be used with
+        Player(..., room_table=world.room_table) and
+        find_path(..., room_table=world.room_table).
+        """
+        if compact:
+            self.rooms = {}
+            self.room_grid = {}
+            self.room_table = RoomTable.from_records(read_map(map_file))
+            self.grid_size = max(max(self.room_table.x), max(self.room_table.y)) + 1
+            self.starting_room = 0
+        else:
+            self.load_rooms(read_map(map_file))
+
+    def load_rooms(self, records):
+        """
+        Build the world in one pass over (room_id, (x, y), exits) records.
+        A room referenced by an exit before its own record has been read is
+        created on the spot and gets its coordinates when the record comes.
+        """
+        self.rooms = {}
+        self.room_grid = {}
+        self.room_table = None
+        rooms = self.rooms
         grid_size = 1
-        for i in range(0, num_rooms):
-            x = room_graph[i][0][0]
-            grid_size = max(grid_size, room_graph[i][0][0], room_graph[i][0][1])
-            self.rooms[i] = Room(f"Room {i}", f"({room_graph[i][0][0]},{room_graph[i][0][1]})",i, room_graph[i][0][0], room_graph[i][0][1])
-        self.room_grid = []
-        grid_size += 1
-        self.grid_size = grid_size
-        for i in range(0, grid_size):
-            self.room_grid.append([None] * grid_size)
-        for room_id in room_graph:
-            room = self.rooms[room_id]
-            self.room_grid[room.x][room.y] = room
-            if 'n' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('n', self.rooms[room_graph[room_id][1]['n']])
-            if 's' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('s', self.rooms[room_graph[room_id][1]['s']])
-            if 'e' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('e', self.rooms[room_graph[room_id][1]['e']])
-            if 'w' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('w', self.rooms[room_graph[room_id][1]['w']])
-        self.starting_room = self.rooms[0]
+        for room_id, (x, y), exits in records:
+            grid_size = max(grid_size, x, y)
+            if room_id in rooms:
+                room = rooms[room_id]
+                room.description = f"({x},{y})"
+                room.x = x
+                room.y = y
+            else:
+                room = Room(f"Room {room_id}", f"({x},{y})", room_id, x, y)
+                rooms[room_id] = room
+            self.room_grid[(x, y)] = room
+            for direction, other_id in exits.items():
+                if other_id not in rooms:
+                    rooms[other_id] = Room(f"Room {other_id}", None, other_id)
+                room.connect_rooms(direction, rooms[other_id])
+        self.grid_size = grid_size + 1
+        self.starting_room = rooms[0]
 
     def print_rooms(self):
-        rotated_room_grid = []
-        for i in range(0, len(self.room_grid)):
-            rotated_room_grid.append([None] * len(self.room_grid))
-        for i in range(len(self.room_grid)):
-            for j in range(len(self.room_grid[0])):
-                rotated_room_grid[len(self.room_grid[0]) - j - 1][i] = self.room_grid[i][j]
+        # Rows run from the top (highest y) down, skipping rows with no
+        # rooms; columns cover every x in the grid.
+        columns = range(self.grid_size)
+        rotated_room_grid = [
+            [self.room_grid.get((x, y)) for x in columns]
+            for y in sorted({y for (_, y) in self.room_grid}, reverse=True)
+        ]
         print("#####")
         str = ""
         for row in rotated_room_grid:
@@ -1,28 +1,80 @@
-from graph import Graph
+from graphs import Graph
+
+
+class AncestryIndex:
+    """
+    Child -> parents index built once from a list of (parent, child) pairs.
+
+    For every node it memoizes (depth, ancestor): the length of the longest
+    route to a root and the lowest-id ancestor at that distance. Each node
+    is resolved at most once, so any sequence of queries costs O(V + E) in
+    total and repeat queries are a dict lookup.
+    """
+    def __init__(self, ancestors):
+        self.parents = {}
+        for parent, child in ancestors:
+            if child not in self.parents:
+                self.parents[child] = []
+            self.parents[child].append(parent)
+        self.memo = {}
+
+    def _resolve(self, node):
+        """
+        Fill the memo for node and every unresolved ancestor of it.
+
+        Works post-order over an explicit stack of (node, remaining parents)
+        frames, so arbitrarily deep pedigrees don't hit the recursion limit.
+        Raises if a node turns out to be its own ancestor.
+        """
+        memo = self.memo
+        if node in memo:
+            return memo[node]
+        parents = self.parents
+        frames = [(node, iter(parents.get(node, ())))]
+        on_stack = {node}
+        while frames:
+            cur_node, remaining = frames[-1]
+            for parent in remaining:
+                if parent not in memo:
+                    if parent in on_stack:
+                        raise Exception(f'node "{parent}" is its own ancestor')
+                    frames.append((parent, iter(parents.get(parent, ()))))
+                    on_stack.add(parent)
+                    break
+            else:
+                frames.pop()
+                on_stack.remove(cur_node)
+                best = (0, cur_node)
+                for parent in parents.get(cur_node, ()):
+                    depth, ancestor = memo[parent]
+                    depth += 1
+                    if depth > best[0] or (depth == best[0] and ancestor < best[1]):
+                        best = (depth, ancestor)
+                memo[cur_node] = best
+        return memo[node]
+
+    def earliest_ancestor(self, starting_node):
+        """
+        Return the ancestor farthest from starting_node, preferring the
+        lowest id on ties, or -1 if starting_node has no parents.
+        """
+        depth, ancestor = self._resolve(starting_node)
+        return ancestor if depth > 0 else -1
+
+    def earliest_ancestors(self, starting_nodes):
+        """
+        Return a list with earliest_ancestor for each of starting_nodes.
+        """
+        memo = self.memo
+        results = []
+        for node in starting_nodes:
+            if node in memo:
+                depth, ancestor = memo[node]
+            else:
+                depth, ancestor = self._resolve(node)
+            results.append(ancestor if depth > 0 else -1)
+        return results
+
+
 def earliest_ancestor(ancestors, starting_node):
-    child_parent_association = {}
-
-    for ancestor in ancestors:
-        if ancestor[1] not in child_parent_association:
-            child_parent_association[ancestor[1]] = set()
-        child_parent_association[ancestor[1]].add(ancestor[0])
-
-    longest_route_length = 0
-    farthest_ancestor = -1
-
-    def next_ancestor(cur_ancestor, cur_length):
-        nonlocal longest_route_length
-        nonlocal farthest_ancestor
-        if cur_length >= longest_route_length:
-            if cur_length > longest_route_length\
-                    or (cur_length == longest_route_length\
-                        and cur_ancestor < farthest_ancestor):
-                longest_route_length = cur_length
-                farthest_ancestor = cur_ancestor
-        if cur_ancestor in child_parent_association:
-            for ancestor in child_parent_association[cur_ancestor]:
-                next_ancestor(ancestor, cur_length + 1)
-
-    next_ancestor(starting_node, 0)
-
-    return farthest_ancestor
+    return AncestryIndex(ancestors).earliest_ancestor(starting_node)
@@ -1,5 +1,5 @@
 import unittest
-from ancestor import earliest_ancestor
+from ancestor import earliest_ancestor, AncestryIndex
 
 class Test(unittest.TestCase):
 
@@ -26,5 +26,37 @@ class Test(unittest.TestCase):
         self.assertEqual(earliest_ancestor(test_ancestors, 10), -1)
         self.assertEqual(earliest_ancestor(test_ancestors, 11), -1)
 
+    def test_ancestry_index(self):
+        test_ancestors = [(1, 3), (2, 3), (3, 6), (5, 6), (5, 7), (4, 5), (4, 8), (8, 9), (11, 8), (10, 1)]
+        index = AncestryIndex(test_ancestors)
+        self.assertEqual(
+            index.earliest_ancestors(range(1, 12)),
+            [10, -1, 10, -1, 4, 10, 4, 4, 4, -1, -1],
+        )
+        self.assertEqual(index.earliest_ancestor(6), 10)
+
+    def test_diamond_pedigree(self):
+        '''
+        Each level doubles the number of root paths: 0 -> {1, 2} -> 3 ->
+        {4, 5} -> 6 ... so enumerating paths would take 2**100 steps.
+        '''
+        test_ancestors = []
+        for level in range(100):
+            top = level * 3
+            test_ancestors += [(top, top + 1), (top, top + 2), (top + 1, top + 3), (top + 2, top + 3)]
+        self.assertEqual(earliest_ancestor(test_ancestors, 300), 0)
+
+    def test_deep_chain(self):
+        test_ancestors = [(i, i + 1) for i in range(1_000_000)]
+        self.assertEqual(earliest_ancestor(test_ancestors, 1_000_000), 0)
+        self.assertEqual(earliest_ancestor(test_ancestors, 0), -1)
+
+    def test_cycle(self):
+        test_ancestors = [(1, 2), (2, 3), (3, 4), (4, 2), (5, 6)]
+        index = AncestryIndex(test_ancestors)
+        with self.assertRaises(Exception):
+            index.earliest_ancestor(4)
+        self.assertEqual(index.earliest_ancestor(6), 5)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,127 @@
+import asyncio
+import random
+import time
+import unittest
+from graphs import AsyncGraph, Graph
+from graphs.async_graph import LOOKAHEAD
+
+LATENCY = 0.01
+
+class FakeStore:
+    """In-process adjacency store whose lookups each take LATENCY seconds."""
+    def __init__(self, vertices):
+        self.vertices = vertices
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lookups = 0
+
+    async def get_neighbors(self, vertex):
+        self.lookups += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(LATENCY)
+        finally:
+            self.in_flight -= 1
+        return self.vertices.get(vertex)
+
+class Test(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.graph = Graph()
+        for i in range(1, 8):
+            self.graph.add_vertex(i)
+        for v1, v2 in [(5, 3), (6, 3), (7, 1), (4, 7), (1, 2), (7, 6), (2, 4), (3, 5), (2, 3), (4, 6)]:
+            self.graph.add_edge(v1, v2)
+        self.store = FakeStore(self.graph.vertices)
+        self.async_graph = AsyncGraph(self.store.get_neighbors)
+
+    async def test_breadth_first(self):
+        order = [vertex async for vertex in self.async_graph.breadth_first_iter(1)]
+        self.assertEqual(order[:2], [1, 2])
+        self.assertCountEqual(order[2:4], [3, 4])
+        self.assertCountEqual(order[4:], [5, 6, 7])
+        # One lookup per level, all of a level's lookups at once.
+        self.assertEqual(self.store.max_in_flight, 3)
+        self.assertListEqual(await self.async_graph.bfs(1, 6), [1, 2, 4, 6])
+        self.assertIsNone(await AsyncGraph.from_vertices({1: {2}, 2: set()}).bfs(2, 1))
+
+    async def test_depth_first(self):
+        dft = [
+            [1, 2, 3, 5, 4, 6, 7],
+            [1, 2, 3, 5, 4, 7, 6],
+            [1, 2, 4, 7, 6, 3, 5],
+            [1, 2, 4, 6, 3, 5, 7]
+        ]
+        self.assertIn([vertex async for vertex in self.async_graph.depth_first_iter(1)], dft)
+        self.assertIn(await self.async_graph.dfs(1, 6), [[1, 2, 4, 6], [1, 2, 4, 7, 6]])
+        self.assertEqual(self.store.in_flight, 0)
+
+    async def test_unknown_vertex(self):
+        for search in (self.async_graph.bfs, self.async_graph.dfs):
+            with self.assertRaises(Exception):
+                await search(99, 1)
+            # Like Graph.bfs, an unknown destination raises rather than
+            # searching the whole graph and returning None.
+            self.store.lookups = 0
+            with self.assertRaises(Exception):
+                await search(1, 99)
+            self.assertLessEqual(self.store.lookups, 2)
+        self.assertEqual(self.store.in_flight, 0)
+
+    async def test_failed_lookup_cancels_level(self):
+        # 0's neighbors include 99, which the store doesn't have.
+        store = FakeStore({0: [1, 2, 3, 99], 1: [], 2: [], 3: []})
+        with self.assertRaises(Exception):
+            await AsyncGraph(store.get_neighbors).bfs(0, 3)
+        self.assertEqual(store.in_flight, 0)
+
+    async def test_early_break_bounds_lookups(self):
+        num_vertices = 20_000
+        rng = random.Random(2)
+        vertices = {i: set() for i in range(num_vertices)}
+        for _ in range(4 * num_vertices):
+            v1, v2 = rng.randrange(num_vertices), rng.randrange(num_vertices)
+            vertices[v1].add(v2)
+            vertices[v2].add(v1)
+        store = FakeStore(vertices)
+        max_concurrency = 8
+        async_graph = AsyncGraph(store.get_neighbors, max_concurrency=max_concurrency)
+        bound = 10 + LOOKAHEAD * max_concurrency + 1
+
+        traversal = async_graph.depth_first_iter(0)
+        order = []
+        async for vertex in traversal:
+            order.append(vertex)
+            if len(order) == 10:
+                break
+        self.assertLessEqual(store.max_in_flight, max_concurrency)
+        # Lookups already running may finish, but cannot start a crawl.
+        await asyncio.sleep(5 * LATENCY)
+        self.assertLessEqual(store.lookups, bound)
+        await traversal.aclose()
+        self.assertEqual(store.in_flight, 0)
+        self.assertLessEqual(store.lookups, bound)
+
+    async def test_overlapping_lookups(self):
+        # A wide random graph: waiting on each lookup in turn would take
+        # num_vertices * LATENCY.
+        num_vertices = 300
+        rng = random.Random(5)
+        vertices = {i: set() for i in range(num_vertices)}
+        for i in range(1, num_vertices):
+            vertices[rng.randrange(i)].add(i)
+        store = FakeStore(vertices)
+        async_graph = AsyncGraph(store.get_neighbors, max_concurrency=50)
+
+        for traversal in (async_graph.breadth_first_iter, async_graph.depth_first_iter):
+            store.max_in_flight = 0
+            start = time.perf_counter()
+            order = [vertex async for vertex in traversal(0)]
+            elapsed = time.perf_counter() - start
+            self.assertCountEqual(order, range(num_vertices))
+            self.assertLess(elapsed, num_vertices * LATENCY / 3)
+            self.assertLessEqual(store.max_in_flight, 50)
+            self.assertGreater(store.max_in_flight, 1)
+
+if __name__ == '__main__':
+    unittest.main()
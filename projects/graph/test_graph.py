@@ -1,7 +1,11 @@
 import unittest
+import random
 import sys
 import io
-from graph import Graph
+import os
+import tempfile
+import threading
+from graphs import CSRGraph, Graph, GraphSnapshot, IndexedGraph
 
 class Test(unittest.TestCase):
     def setUp(self):
@@ -101,6 +105,56 @@ class Test(unittest.TestCase):
         bfs = [1, 2, 4, 6]
         self.assertListEqual(self.graph.bfs(1, 6), bfs)
 
+    def test_bidirectional_bfs(self):
+        self.assertListEqual(self.graph.bidirectional_bfs(1, 6), [1, 2, 4, 6])
+        self.assertListEqual(self.graph.bidirectional_bfs(6, 5), [6, 3, 5])
+        self.assertListEqual(self.graph.bidirectional_bfs(3, 3), [3])
+        self.assertIsNone(self.graph.bidirectional_bfs(3, 1))
+
+    def test_bidirectional_bfs_matches_bfs(self):
+        rng = random.Random(42)
+        graph = Graph()
+        for i in range(200):
+            graph.add_vertex(i)
+        for _ in range(600):
+            graph.add_edge(rng.randrange(200), rng.randrange(200))
+        for _ in range(200):
+            start, dest = rng.randrange(200), rng.randrange(200)
+            expected = graph.bfs(start, dest)
+            path = graph.bidirectional_bfs(start, dest)
+            if expected is None:
+                self.assertIsNone(path)
+                continue
+            self.assertEqual(len(path), len(expected))
+            self.assertEqual((path[0], path[-1]), (start, dest))
+            for v1, v2 in zip(path, path[1:]):
+                self.assertIn(v2, graph.vertices[v1])
+
+    def test_multi_source_bfs(self):
+        distances, nearest = self.graph.multi_source_bfs([3, 7])
+        self.assertDictEqual(distances, {3: 0, 5: 1, 7: 0, 1: 1, 6: 1, 2: 2, 4: 3})
+        self.assertDictEqual(nearest, {3: 3, 5: 3, 7: 7, 1: 7, 6: 7, 2: 7, 4: 7})
+        with self.assertRaises(Exception):
+            self.graph.multi_source_bfs([1, 99])
+
+    def test_bfs_many(self):
+        rng = random.Random(7)
+        graph = Graph()
+        for i in range(100):
+            graph.add_vertex(i)
+        for _ in range(250):
+            graph.add_edge(rng.randrange(100), rng.randrange(100))
+        pairs = [(rng.randrange(5), rng.randrange(100)) for _ in range(100)]
+        for (start, dest), path in zip(pairs, graph.bfs_many(pairs)):
+            expected = graph.bfs(start, dest)
+            if expected is None:
+                self.assertIsNone(path)
+                continue
+            self.assertEqual(len(path), len(expected))
+            self.assertEqual((path[0], path[-1]), (start, dest))
+            for v1, v2 in zip(path, path[1:]):
+                self.assertIn(v2, graph.vertices[v1])
+
     def test_dfs(self):
         dfs = [
             [1, 2, 4, 6],
@@ -115,5 +169,200 @@ class Test(unittest.TestCase):
         ]
         self.assertIn(self.graph.dfs_recursive(1,6), dfs)
 
+    def test_dft_paths(self):
+        order = []
+        for vertex, path in self.graph.depth_first_stack_iter(1, with_paths=True):
+            order.append(vertex)
+            self.assertEqual(path[0], 1)
+            self.assertEqual(path[-1], vertex)
+            for v1, v2 in zip(path, path[1:]):
+                self.assertIn(v2, self.graph.vertices[v1])
+        self.assertListEqual(order, list(self.graph.depth_first_stack_iter(1)))
+
+    def test_frozen_bft(self):
+        bft = [
+            [1, 2, 3, 4, 5, 6, 7],
+            [1, 2, 3, 4, 5, 7, 6],
+            [1, 2, 3, 4, 6, 7, 5],
+            [1, 2, 3, 4, 6, 5, 7],
+            [1, 2, 3, 4, 7, 6, 5],
+            [1, 2, 3, 4, 7, 5, 6],
+            [1, 2, 4, 3, 5, 6, 7],
+            [1, 2, 4, 3, 5, 7, 6],
+            [1, 2, 4, 3, 6, 7, 5],
+            [1, 2, 4, 3, 6, 5, 7],
+            [1, 2, 4, 3, 7, 6, 5],
+            [1, 2, 4, 3, 7, 5, 6]
+        ]
+        frozen = self.graph.freeze()
+        self.assertIn(list(frozen.breadth_first_iter(1)), bft)
+
+    def test_frozen_dft(self):
+        dft = [
+            [1, 2, 3, 5, 4, 6, 7],
+            [1, 2, 3, 5, 4, 7, 6],
+            [1, 2, 4, 7, 6, 3, 5],
+            [1, 2, 4, 6, 3, 5, 7]
+        ]
+        frozen = self.graph.freeze()
+        self.assertIn(list(frozen.depth_first_stack_iter(1)), dft)
+
+    def test_frozen_search(self):
+        frozen = self.graph.freeze()
+        self.assertEqual(len(frozen), 7)
+        self.assertEqual(frozen.num_edges, 10)
+        self.assertListEqual(frozen.bfs(1, 6), [1, 2, 4, 6])
+        self.assertIn(frozen.dfs(1, 6), [[1, 2, 4, 6], [1, 2, 4, 7, 6]])
+        self.assertCountEqual(frozen.get_neighbors(4), [6, 7])
+        with self.assertRaises(Exception):
+            frozen.bfs(1, 99)
+
+    def indexed_graph(self):
+        # Vertex 0 is left unconnected so the labels match self.graph.
+        graph = IndexedGraph(8)
+        for v1, neighbors in self.graph.vertices.items():
+            for v2 in neighbors:
+                graph.add_edge(v1, v2)
+        return graph
+
+    def test_indexed_traversal(self):
+        graph = self.indexed_graph()
+        self.assertEqual(graph.num_edges, 10)
+        self.assertIn(
+            list(graph.breadth_first_iter(1)),
+            [[1, 2] + middle + last for middle in ([3, 4], [4, 3])
+             for last in ([5, 6, 7], [5, 7, 6], [6, 7, 5], [6, 5, 7], [7, 6, 5], [7, 5, 6])],
+        )
+        self.assertIn(list(graph.depth_first_stack_iter(1)), [
+            [1, 2, 3, 5, 4, 6, 7],
+            [1, 2, 3, 5, 4, 7, 6],
+            [1, 2, 4, 7, 6, 3, 5],
+            [1, 2, 4, 6, 3, 5, 7]
+        ])
+        self.assertListEqual(list(graph.breadth_first_iter(0)), [0])
+
+    def test_indexed_search(self):
+        graph = self.indexed_graph()
+        self.assertListEqual(graph.bfs(1, 6), [1, 2, 4, 6])
+        self.assertIn(graph.dfs(1, 6), [[1, 2, 4, 6], [1, 2, 4, 7, 6]])
+        self.assertIsNone(graph.bfs(1, 0))
+        self.assertEqual(graph.add_vertex(), 8)
+        with self.assertRaises(Exception):
+            graph.add_edge(1, 9)
+
+    def test_from_edges(self):
+        edges = ((v1, v2) for v1, neighbors in self.graph.vertices.items() for v2 in neighbors)
+        graph = Graph.from_edges(edges, vertices=[8])
+        self.assertDictEqual(graph.vertices, {**self.graph.vertices, 8: set()})
+        self.assertDictEqual(graph.predecessors, {**self.graph.predecessors, 8: set()})
+        graph = Graph.from_edges([(1, 2), (1, 2), (2, 1)])
+        self.assertDictEqual(graph.vertices, {1: {2}, 2: {1}})
+
+    def test_saved_csr(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.csr')
+            self.graph.freeze().save(path)
+            loaded = CSRGraph.load(path)
+            self.assertEqual(len(loaded), 7)
+            self.assertEqual(loaded.num_edges, 10)
+            self.assertListEqual(loaded.bfs(1, 6), [1, 2, 4, 6])
+            self.assertIn(loaded.dfs(1, 6), [[1, 2, 4, 6], [1, 2, 4, 7, 6]])
+            self.assertCountEqual(loaded.get_neighbors(4), [6, 7])
+            self.assertNotIn(99, loaded)
+
+            chain = Graph.from_edges((i, i + 1) for i in range(999))
+            chain.freeze().save(path)
+            loaded = CSRGraph.load(path)
+            self.assertIsInstance(loaded.labels, range)
+            self.assertEqual(list(loaded.depth_first_stack_iter(0)), list(range(1000)))
+            with self.assertRaises(Exception):
+                loaded.bfs(0, 'a')
+            del loaded
+
+            with self.assertRaises(Exception):
+                Graph.from_edges([('a', 'b')]).freeze().save(path)
+
+    def test_snapshot(self):
+        snapshot = self.graph.snapshot()
+        self.assertIs(self.graph.snapshot(), snapshot)
+        self.graph.add_vertex(8)
+        self.graph.add_edge(7, 8)
+        self.assertNotIn(8, snapshot.vertices)
+        self.assertEqual(len(snapshot.vertices), 7)
+        self.assertDictEqual(dict(snapshot.predecessors), {
+            1: {7}, 2: {1}, 3: {2, 5, 6}, 4: {2}, 5: {3}, 6: {4, 7}, 7: {4}
+        })
+        self.assertSetEqual(snapshot.vertices[7], {1, 6})
+        self.assertSetEqual(self.graph.vertices[7], {1, 6, 8})
+        self.assertEqual(self.graph.version - snapshot.version, 2)
+        self.assertListEqual(snapshot.bfs(1, 6), [1, 2, 4, 6])
+        with self.assertRaises(Exception):
+            snapshot.bfs(1, 8)
+        self.assertListEqual(self.graph.snapshot().bfs(1, 8), [1, 2, 4, 7, 8])
+        with self.assertRaises(Exception):
+            snapshot.add_edge(1, 3)
+        with self.assertRaisesRegex(Exception, 'read-only'):
+            GraphSnapshot.from_edges([(1, 2)])
+
+    def test_snapshot_concurrent_writes(self):
+        num_vertices = 300
+        rng = random.Random(3)
+        edges = list({(rng.randrange(num_vertices), rng.randrange(num_vertices)) for _ in range(6000)})
+        graph = Graph()
+        for i in range(num_vertices):
+            graph.add_vertex(i)
+        done = threading.Event()
+        errors = []
+
+        def write():
+            for v1, v2 in edges:
+                graph.add_edge(v1, v2)
+            done.set()
+
+        def read():
+            try:
+                while not done.is_set():
+                    snapshot = graph.snapshot()
+                    # Every write so far is one vertex or one new edge.
+                    num_edges = snapshot.version - num_vertices
+                    reached = set(snapshot.breadth_first_iter(0))
+                    reached.update(snapshot.depth_first_stack_iter(0))
+                    self.assertTrue(reached <= snapshot.vertices.keys())
+                    self.assertEqual(sum(map(len, snapshot.vertices.values())), num_edges)
+                    self.assertEqual(sum(map(len, snapshot.predecessors.values())), num_edges)
+            except Exception as error:
+                errors.append(error)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        writer = threading.Thread(target=write)
+        for thread in readers + [writer]:
+            thread.start()
+        for thread in readers + [writer]:
+            thread.join()
+        self.assertListEqual(errors, [])
+        self.assertEqual(graph.snapshot().version, num_vertices + len(edges))
+
+    def test_deep_chain(self):
+        chain_length = 1_000_000
+        graph = Graph()
+        for i in range(chain_length):
+            graph.add_vertex(i)
+        for i in range(chain_length - 1):
+            graph.add_edge(i, i + 1)
+
+        stdout_ = sys.stdout
+        sys.stdout = io.StringIO()
+        graph.dft_recursive(0)
+        output = sys.stdout.getvalue()
+        sys.stdout = stdout_  # Restore stdout
+
+        self.assertEqual(output.count("\n"), chain_length)
+        self.assertTrue(output.endswith(f"{chain_length - 1}\n"))
+        for search in (graph.dfs, graph.dfs_recursive):
+            path = search(0, chain_length - 1)
+            self.assertEqual(len(path), chain_length)
+            self.assertEqual(path[-1], chain_length - 1)
+        self.assertIsNone(graph.dfs_recursive(1, 0))
+
 if __name__ == '__main__':
     unittest.main()
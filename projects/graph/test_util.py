@@ -0,0 +1,44 @@
+import unittest
+from graphs import Queue, Stack, UnionFind
+
+class Test(unittest.TestCase):
+    def test_queue_fifo(self):
+        queue = Queue()
+        queue.enqueue(1)
+        queue.extend([2, 3])
+        self.assertEqual(len(queue), 3)
+        self.assertEqual(queue.size(), 3)
+        self.assertEqual([queue.dequeue() for _ in range(3)], [1, 2, 3])
+
+    def test_queue_empty(self):
+        queue = Queue()
+        self.assertFalse(queue)
+        self.assertIsNone(queue.dequeue())
+        queue.enqueue(None)
+        self.assertTrue(queue)
+
+    def test_stack_lifo(self):
+        stack = Stack()
+        stack.push(1)
+        stack.push(2)
+        self.assertEqual(stack.pop(), 2)
+        self.assertEqual(stack.pop(), 1)
+        self.assertIsNone(stack.pop())
+
+    def test_union_find(self):
+        sets = UnionFind(5)
+        self.assertTrue(sets.union(0, 1))
+        self.assertTrue(sets.union(3, 4))
+        self.assertFalse(sets.union(1, 0))
+        self.assertEqual(sets.num_components, 3)
+        self.assertTrue(sets.connected(0, 1))
+        self.assertFalse(sets.connected(1, 3))
+        self.assertEqual(sets.add(), 5)
+        sets.union(5, 4)
+        sets.union(0, 5)
+        self.assertEqual(sets.component_size(3), 5)
+        self.assertEqual(sets.component_size(2), 1)
+        self.assertEqual(sets.num_components, 2)
+
+if __name__ == '__main__':
+    unittest.main()
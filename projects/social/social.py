@@ -1,4 +1,15 @@
+import os
 import random
+from collections import deque, namedtuple
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from graphs import UnionFind
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only needed for the 'numpy' strategy and edges_array
+    np = None
 
 class User:
     def __init__(self, name):
@@ -6,12 +17,225 @@ class User:
     def __repr__(self):
         return self.name
 
+class SocialPath(Sequence):
+    """
+    Lazy view of the shortest friendship path to one user. The path is
+    rebuilt from the predecessor map only when it is iterated or indexed.
+    """
+    __slots__ = ('paths', 'user_id')
+
+    def __init__(self, paths, user_id):
+        self.paths = paths
+        self.user_id = user_id
+
+    def __len__(self):
+        return self.paths.depths[self.user_id] + 1
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __getitem__(self, index):
+        return self.to_list()[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (SocialPath, list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self.to_list())
+
+    def to_list(self):
+        parents = self.paths.parents
+        path = [self.user_id]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return path
+
+
+class SocialPaths(Mapping):
+    """
+    Read-only mapping of user_id -> SocialPath for every user reachable
+    from a source user, backed by a predecessor map and BFS depths so it
+    costs O(reachable users) memory regardless of path lengths.
+    """
+    def __init__(self, source, parents, depths):
+        self.source = source
+        self.parents = parents
+        self.depths = depths
+
+    def __getitem__(self, user_id):
+        if user_id not in self.parents:
+            raise KeyError(user_id)
+        return SocialPath(self, user_id)
+
+    def __iter__(self):
+        return iter(self.parents)
+
+    def __len__(self):
+        return len(self.parents)
+
+    def __contains__(self, user_id):
+        return user_id in self.parents
+
+    def __repr__(self):
+        return repr({user_id: self[user_id].to_list() for user_id in self.parents})
+
+
+NetworkStats = namedtuple('NetworkStats', [
+    'user_id',
+    'reach',            # users in the extended network, not counting user_id
+    'reach_percent',    # reach as a percentage of all other users
+    'mean_separation',  # average degrees of separation over that network
+    'max_separation',   # degrees of separation to the farthest of them
+])
+
+
+def level_counts(friendships, num_slots, user_id):
+    """
+    Breadth-first search from user_id that only counts users per level:
+    returns a list whose item d is the number of users d friendships away.
+    num_slots must exceed every user id.
+    """
+    visited = bytearray(num_slots)
+    visited[user_id] = 1
+    frontier = [user_id]
+    counts = []
+    while frontier:
+        counts.append(len(frontier))
+        next_frontier = []
+        for cur_user in frontier:
+            for friend_id in friendships[cur_user]:
+                if not visited[friend_id]:
+                    visited[friend_id] = 1
+                    next_frontier.append(friend_id)
+        frontier = next_frontier
+    return counts
+
+
+def stats_from_levels(user_id, counts, num_users):
+    """
+    Build user_id's NetworkStats from its level_counts in a network of
+    num_users users.
+    """
+    reach = sum(counts) - 1
+    separation = sum(depth * count for depth, count in enumerate(counts))
+    return NetworkStats(
+        user_id,
+        reach,
+        100 * reach / (num_users - 1) if num_users > 1 else 0.0,
+        separation / reach if reach else 0.0,
+        len(counts) - 1,
+    )
+
+
+# Friendships and user count each worker process searches, set by
+# _init_worker.
+_worker_graph = None
+
+
+def _init_worker(friendships, num_slots, num_users):
+    global _worker_graph
+    _worker_graph = (friendships, num_slots, num_users)
+
+
+def _stats_in_worker(user_id):
+    friendships, num_slots, num_users = _worker_graph
+    return stats_from_levels(user_id, level_counts(friendships, num_slots, user_id), num_users)
+
+
 class SocialGraph:
     def __init__(self):
         self.last_id = 0
         self.users = {}
         self.friendships = {}
 
+    @property
+    def friendships(self):
+        """
+        Dict mapping each user_id to the set of their friends' ids. After a
+        'numpy' populate_graph it is only built from the edge array the
+        first time it is accessed.
+        """
+        if self._friendships is None:
+            friendships = {user_id: set() for user_id in self.users}
+            for user_id, friend_id in self._edges.tolist():
+                friendships[user_id].add(friend_id)
+                friendships[friend_id].add(user_id)
+            self._friendships = friendships
+        return self._friendships
+
+    @friendships.setter
+    def friendships(self, friendships):
+        self._friendships = friendships
+        self._edges = None
+        self._components = None
+
+    def _union_find(self):
+        """
+        UnionFind indexed by user_id (slot 0 is unused), built from the
+        current friendships on first use and then kept up to date by
+        add_user and add_friendship.
+        """
+        if self._components is None:
+            components = UnionFind(self.last_id + 1)
+            for user_id, friends in self.friendships.items():
+                for friend_id in friends:
+                    if user_id < friend_id:
+                        components.union(user_id, friend_id)
+            self._components = components
+        return self._components
+
+    def connected_components(self):
+        """
+        Return the connected components of the friendship graph as sets of
+        user ids, largest first.
+        """
+        components = self._union_find()
+        members = {}
+        for user_id in self.users:
+            members.setdefault(components.find(user_id), set()).add(user_id)
+        return sorted(members.values(), key=len, reverse=True)
+
+    def component_size(self, user_id):
+        """
+        Return the number of users in user_id's connected component.
+        """
+        return self._union_find().component_size(user_id)
+
+    def are_connected(self, user_id, friend_id):
+        """
+        Return whether a chain of friendships links the two users.
+        """
+        return self._union_find().connected(user_id, friend_id)
+
+    def edges_array(self, symmetric=False):
+        """
+        Return the friendships as an (num_friendships, 2) int64 NumPy array
+        with user_id < friend_id in each row. With symmetric=True every
+        friendship appears in both directions.
+
+        The array is a read-only view of the graph's own edge list; copy
+        it to modify it.
+        """
+        if np is None:
+            raise Exception('numpy is required for edges_array')
+        if self._edges is None:
+            pairs = [
+                (user_id, friend_id)
+                for user_id, friends in self._friendships.items()
+                for friend_id in friends
+                if user_id < friend_id
+            ]
+            self._edges = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+        if symmetric:
+            edges = np.concatenate((self._edges, self._edges[:, ::-1]))
+        else:
+            edges = self._edges.view()
+        edges.setflags(write=False)
+        return edges
+
     def add_friendship(self, user_id, friend_id):
         """
         Creates a bi-directional friendship
@@ -23,6 +247,9 @@ class SocialGraph:
         else:
             self.friendships[user_id].add(friend_id)
             self.friendships[friend_id].add(user_id)
+            self._edges = None
+            if self._components is not None:
+                self._components.union(user_id, friend_id)
 
     def add_user(self, name):
         """
@@ -31,25 +258,141 @@ class SocialGraph:
         self.last_id += 1  # automatically increment the ID to assign the new user
         self.users[self.last_id] = User(name)
         self.friendships[self.last_id] = set()
+        if self._components is not None:
+            self._components.add()
 
-    def populate_graph(self, num_users, avg_friendships):
+    def populate_graph(self, num_users, avg_friendships, strategy='sample', seed=None):
         """
         Takes a number of users and an average number of friendships
         as arguments
         Creates that number of users and a randomly distributed friendships
         between those users.
         The number of users must be greater than the average number of friendships.
+
+        strategy selects how friendships are drawn:
+            'sample'  - rejection-sample random pairs until enough distinct
+                        friendships exist; O(num_users * avg_friendships).
+                        Requests for more than half of all possible pairs
+                        fall back to 'shuffle', where most draws would be
+                        rejected.
+            'shuffle' - shuffle the list of every possible pair and take a
+                        prefix; O(num_users ** 2), kept for comparison.
+            'numpy'   - sample pairs in vectorized batches and keep them as
+                        an edge array; friendships is built lazily (see
+                        edges_array). Requires numpy.
+        All three draw a uniformly random set of friendships and are
+        deterministic for a given seed. Without a seed, 'sample' and
+        'shuffle' use the random module, so random.seed() applies. 'numpy'
+        draws more distinct pairs than needed over one or more batches and
+        then keeps a random subset of exactly the required size, so the
+        result is still uniform, but it differs from the other two for the
+        same seed.
         """
+        if num_users <= avg_friendships:
+            raise Exception('the number of users must be greater than the average number of friendships')
+        if strategy not in ('sample', 'shuffle', 'numpy'):
+            raise Exception(f'unknown populate strategy "{strategy}"')
+        rng = random if seed is None else random.Random(seed)
+
         # Reset graph
         self.last_id = 0
         self.users = {}
         self.friendships = {}
 
+        if strategy == 'numpy':
+            self._populate_numpy(num_users, num_users * avg_friendships // 2, seed)
+            return
+
         # Add users
         for i in range(num_users):
             self.add_user(f"User {i+1}")
 
-        # Create friendships
+        # avg_friendships = total_friendships / num_users
+        # total_friendships = avg_friendships * num_users
+        # N = avg_friendships * num_users // 2
+        num_friendships = num_users * avg_friendships // 2
+
+        # Past half of all possible pairs, most random draws would be rejected.
+        num_pairs = num_users * (num_users - 1) // 2
+        if strategy == 'sample' and 2 * num_friendships <= num_pairs:
+            self._sample_friendships(num_friendships, rng)
+        else:
+            self._shuffle_friendships(num_friendships, rng)
+
+    def _sample_friendships(self, num_friendships, rng):
+        """
+        Draw random pairs, rejecting self-friendships and duplicates. With
+        at most half of all possible pairs taken, fewer than about half of
+        the draws are rejected, so each friendship takes about two draws at
+        most; denser graphs are left to _shuffle_friendships.
+        """
+        friendships = self.friendships
+        last_id = self.last_id
+        randint = rng.randint
+        created = 0
+        while created < num_friendships:
+            user_id = randint(1, last_id)
+            friend_id = randint(1, last_id)
+            if user_id == friend_id or friend_id in friendships[user_id]:
+                continue
+            friendships[user_id].add(friend_id)
+            friendships[friend_id].add(user_id)
+            created += 1
+
+    def _populate_numpy(self, num_users, num_friendships, seed):
+        """
+        Draw friendships as batches of random (low, high) id pairs encoded
+        as single int64 keys, deduplicate with np.unique and repeat until
+        there are enough, then keep a random subset of exactly
+        num_friendships keys. Each batch is scaled up by how many draws
+        are expected to repeat a pair already kept. When more than half of
+        all pairs are needed, pair indices are drawn directly instead.
+        """
+        if np is None:
+            raise Exception('numpy is required for the "numpy" populate strategy')
+        rng = np.random.default_rng(seed)
+        stride = num_users + 1
+        num_pairs = num_users * (num_users - 1) // 2
+        if 2 * num_friendships > num_pairs:
+            keys = self._choose_pair_keys(num_users, num_friendships, rng)
+        else:
+            keys = np.empty(0, dtype=np.int64)
+        while len(keys) < num_friendships:
+            # Only a fraction (num_pairs - len(keys)) / num_pairs of the
+            # draws can be new pairs.
+            needed = (num_friendships - len(keys)) * num_pairs / (num_pairs - len(keys))
+            batch_size = int(needed * 1.1) + 16
+            user_ids = rng.integers(1, num_users + 1, size=batch_size, dtype=np.int64)
+            friend_ids = rng.integers(1, num_users + 1, size=batch_size, dtype=np.int64)
+            distinct = user_ids != friend_ids
+            low = np.minimum(user_ids, friend_ids)[distinct]
+            high = np.maximum(user_ids, friend_ids)[distinct]
+            keys = np.unique(np.concatenate((keys, low * stride + high)))
+        if len(keys) > num_friendships:
+            keys = rng.choice(keys, size=num_friendships, replace=False)
+
+        self.last_id = num_users
+        self.users = {i: User(f"User {i}") for i in range(1, num_users + 1)}
+        self._friendships = None
+        self._edges = np.stack((keys // stride, keys % stride), axis=1)
+
+    @staticmethod
+    def _choose_pair_keys(num_users, num_friendships, rng):
+        """
+        Return the keys of num_friendships distinct pairs chosen uniformly
+        without replacement: indices into the row-major list of every
+        (low, high) pair, decoded with the offset at which each low id's
+        row starts.
+        """
+        num_pairs = num_users * (num_users - 1) // 2
+        indices = rng.choice(num_pairs, size=num_friendships, replace=False).astype(np.int64)
+        # Row low (1-based) holds the num_users - low pairs (low, low + 1..num_users).
+        row_starts = np.concatenate(([0], np.cumsum(np.arange(num_users - 1, 0, -1, dtype=np.int64))))
+        low = np.searchsorted(row_starts, indices, side='right')
+        high = indices - row_starts[low - 1] + low + 1
+        return low * (num_users + 1) + high
+
+    def _shuffle_friendships(self, num_friendships, rng):
         # create a list with all possible friendships
         possible_friendships = []
         for user_id in self.users:
@@ -57,39 +400,72 @@ class SocialGraph:
                 possible_friendships.append((user_id, friend_id))
 
         # Shuffle the list
-        random.shuffle(possible_friendships)
-        print("----")
-        print(possible_friendships)
-        print("----")
+        rng.shuffle(possible_friendships)
         # Grab the first N pairs from the list and create those friendships
-        for i in range(num_users * avg_friendships // 2):
+        for i in range(num_friendships):
             friendship = possible_friendships[i]
             self.add_friendship(friendship[0], friendship[1])
 
-        # avg_friendships = total_friendships / num_users
-        # total_friendships = avg_friendships * num_users
-        # N = avg_friendships * num_users // 2
-
-
     def get_all_social_paths(self, user_id):
         """
         Takes a user's user_id as an argument
-        Returns a dictionary containing every user in that user's
+        Returns a mapping containing every user in that user's
         extended network with the shortest friendship path between them.
-        The key is the friend's ID and the value is the path.
+        The key is the friend's ID and the value is the path, built
+        lazily from a predecessor map.
         """
-        visited = {}  # Note that this is a dictionary, not a set
-        queue = []
+        parents = {user_id: None}
+        depths = {user_id: 0}
+        queue = deque()
         queue.append(user_id)
-        visited[user_id] = [user_id]
         while len(queue) > 0:
-            temp = queue.pop(0)
+            temp = queue.popleft()
             for i in self.friendships[temp]:
-                if i not in visited:
+                if i not in parents:
                     queue.append(i)
-                    visited[i] = visited[temp] + [i]
-        return visited
+                    parents[i] = temp
+                    depths[i] = depths[temp] + 1
+        return SocialPaths(user_id, parents, depths)
+
 
+    def network_stats(self, user_id):
+        """
+        Return the NetworkStats of user_id's extended network, computed
+        from the number of users at each degree of separation rather than
+        from the paths themselves.
+        """
+        if user_id not in self.users:
+            raise Exception(f'user "{user_id}" does not exist')
+        counts = level_counts(self.friendships, self.last_id + 1, user_id)
+        return stats_from_levels(user_id, counts, len(self.users))
+
+    def all_network_stats(self, user_ids=None, processes=None, chunksize=256):
+        """
+        Return a list of network_stats for each of user_ids (every user by
+        default). With processes > 1 the searches are spread over that
+        many worker processes (0 uses every CPU); each worker receives
+        the friendships once, when it starts.
+        """
+        user_ids = list(self.users if user_ids is None else user_ids)
+        for user_id in user_ids:
+            if user_id not in self.users:
+                raise Exception(f'user "{user_id}" does not exist')
+        friendships = self.friendships
+        num_slots = self.last_id + 1
+        num_users = len(self.users)
+        if processes == 0:
+            processes = os.cpu_count() or 1
+        if processes is None or processes <= 1:
+            return [
+                stats_from_levels(user_id, level_counts(friendships, num_slots, user_id), num_users)
+                for user_id in user_ids
+            ]
+        with ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=_init_worker,
+                initargs=(friendships, num_slots, num_users),
+        ) as executor:
+            return list(executor.map(_stats_in_worker, user_ids, chunksize=chunksize))
 
 if __name__ == '__main__':
     sg = SocialGraph()
@@ -99,8 +475,6 @@ if __name__ == '__main__':
     print(sg.friendships)
     connections = sg.get_all_social_paths(1)
     print(connections)
-    # print(len(connections)/10)
-    counter = 0
-    for i in connections:
-        counter += (len(connections[i]) / len(connections))
-    print(counter)
+    stats = sg.network_stats(1)
+    print(f"{stats.reach_percent:.1f}% of users in network, "
+          f"{stats.mean_separation:.2f} average degrees of separation")
@@ -0,0 +1,143 @@
+import random
+import unittest
+from social import SocialGraph, np
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        '''
+        1 - 2 - 3 - 4    5
+             \\     /
+              6 - 7
+        '''
+        self.sg = SocialGraph()
+        for i in range(7):
+            self.sg.add_user(f"User {i + 1}")
+        for user_id, friend_id in [(1, 2), (2, 3), (3, 4), (2, 6), (6, 7), (7, 4)]:
+            self.sg.add_friendship(user_id, friend_id)
+
+    def test_get_all_social_paths(self):
+        paths = self.sg.get_all_social_paths(1)
+        self.assertCountEqual(paths.keys(), [1, 2, 3, 4, 6, 7])
+        self.assertNotIn(5, paths)
+        self.assertEqual(paths[1], [1])
+        self.assertEqual(paths[7], [1, 2, 6, 7])
+        self.assertEqual(len(paths[4]), 4)
+        self.assertEqual(list(paths[4]), [1, 2, 3, 4])
+        self.assertEqual(paths[4][-1], 4)
+
+    def test_populate_graph(self):
+        for strategy in ('sample', 'shuffle'):
+            self.sg.populate_graph(100, 6, strategy=strategy, seed=1)
+            self.assertEqual(len(self.sg.users), 100)
+            degrees = [len(friends) for friends in self.sg.friendships.values()]
+            self.assertEqual(sum(degrees), 100 * 6)
+            for user_id, friends in self.sg.friendships.items():
+                self.assertNotIn(user_id, friends)
+                for friend_id in friends:
+                    self.assertIn(user_id, self.sg.friendships[friend_id])
+
+    def test_populate_graph_unknown_strategy(self):
+        with self.assertRaises(Exception):
+            self.sg.populate_graph(100, 6, strategy='sampel')
+        # The graph is left as it was.
+        self.assertEqual(len(self.sg.users), 7)
+        self.assertSetEqual(self.sg.friendships[2], {1, 3, 6})
+
+    def test_populate_graph_seeded(self):
+        self.sg.populate_graph(50, 4, seed=7)
+        first = {user_id: set(friends) for user_id, friends in self.sg.friendships.items()}
+        self.sg.populate_graph(50, 4, seed=7)
+        self.assertEqual(self.sg.friendships, first)
+
+    def test_populate_graph_dense(self):
+        # Every possible friendship: 'sample' must not spin on rejections.
+        for strategy in ('sample', 'shuffle'):
+            self.sg.populate_graph(200, 199, strategy=strategy, seed=1)
+            for user_id, friends in self.sg.friendships.items():
+                self.assertEqual(len(friends), 199)
+
+    def test_populate_graph_global_seed(self):
+        random.seed(11)
+        self.sg.populate_graph(50, 4)
+        first = {user_id: set(friends) for user_id, friends in self.sg.friendships.items()}
+        random.seed(11)
+        self.sg.populate_graph(50, 4)
+        self.assertEqual(self.sg.friendships, first)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_populate_graph_numpy(self):
+        self.sg.populate_graph(200, 8, strategy='numpy', seed=3)
+        edges = self.sg.edges_array()
+        self.assertEqual(edges.shape, (800, 2))
+        self.assertTrue((edges[:, 0] < edges[:, 1]).all())
+        self.assertEqual(len(set(map(tuple, edges.tolist()))), 800)
+        self.assertEqual(self.sg.edges_array(symmetric=True).shape, (1600, 2))
+        with self.assertRaises(ValueError):
+            edges[0, 0] = 0
+        degrees = [len(friends) for friends in self.sg.friendships.values()]
+        self.assertEqual(len(degrees), 200)
+        self.assertEqual(sum(degrees), 1600)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_populate_graph_numpy_dense(self):
+        # Near saturation almost every random pair is already taken.
+        for num_users, avg_friendships in ((200, 199), (400, 399), (200, 99), (300, 150)):
+            self.sg.populate_graph(num_users, avg_friendships, strategy='numpy', seed=3)
+            edges = self.sg.edges_array()
+            num_friendships = num_users * avg_friendships // 2
+            self.assertEqual(len(set(map(tuple, edges.tolist()))), num_friendships)
+            self.assertTrue((edges[:, 0] < edges[:, 1]).all())
+            self.assertTrue((edges >= 1).all() and (edges <= num_users).all())
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_edges_array_from_friendships(self):
+        self.assertCountEqual(
+            map(tuple, self.sg.edges_array().tolist()),
+            [(1, 2), (2, 3), (3, 4), (2, 6), (6, 7), (4, 7)],
+        )
+
+    def test_connected_components(self):
+        self.assertEqual(self.sg.connected_components(), [{1, 2, 3, 4, 6, 7}, {5}])
+        self.assertEqual(self.sg.component_size(5), 1)
+        self.assertFalse(self.sg.are_connected(1, 5))
+        # Later users and friendships update the components in place.
+        self.sg.add_user("User 8")
+        self.sg.add_friendship(5, 8)
+        self.assertEqual(self.sg.component_size(8), 2)
+        self.sg.add_friendship(8, 4)
+        self.assertTrue(self.sg.are_connected(1, 5))
+        self.assertEqual(self.sg.connected_components(), [{1, 2, 3, 4, 5, 6, 7, 8}])
+
+    def test_connected_components_populated(self):
+        self.sg.populate_graph(300, 2, seed=5)
+        components = self.sg.connected_components()
+        self.assertEqual(sum(len(component) for component in components), 300)
+        for component in components:
+            user_id = next(iter(component))
+            self.assertEqual(set(self.sg.get_all_social_paths(user_id)), component)
+            self.assertEqual(self.sg.component_size(user_id), len(component))
+
+    def test_network_stats(self):
+        stats = self.sg.network_stats(1)
+        self.assertEqual(stats.reach, 5)
+        self.assertAlmostEqual(stats.reach_percent, 100 * 5 / 6)
+        self.assertAlmostEqual(stats.mean_separation, (1 + 2 + 2 + 3 + 3) / 5)
+        self.assertEqual(stats.max_separation, 3)
+        self.assertEqual(self.sg.network_stats(5)[1:], (0, 0.0, 0.0, 0))
+
+    def test_all_network_stats(self):
+        self.sg.populate_graph(200, 3, seed=2)
+        expected = []
+        for user_id in self.sg.users:
+            paths = self.sg.get_all_social_paths(user_id)
+            separations = [len(paths[friend_id]) - 1 for friend_id in paths if friend_id != user_id]
+            expected.append((user_id, len(separations), max(separations, default=0)))
+            if separations:
+                stats = self.sg.network_stats(user_id)
+                self.assertAlmostEqual(stats.mean_separation, sum(separations) / len(separations))
+        for processes in (None, 2):
+            stats = self.sg.all_network_stats(processes=processes, chunksize=16)
+            self.assertEqual([(s.user_id, s.reach, s.max_separation) for s in stats], expected)
+
+if __name__ == '__main__':
+    unittest.main()